@@ -10,8 +10,9 @@ FRED_API_KEY = os.environ.get("FRED_API_KEY")
 # Cache settings
 CACHE_DIR = Path.home() / ".dcf_builder_cache"
 CACHE_TTL_MARKET_DATA = 15 * 60  # 15 minutes for live market data
-CACHE_TTL_HISTORICAL = 24 * 60 * 60  # 24 hours for historical financials
-CACHE_TTL_TREASURY = 60 * 60  # 1 hour for treasury rates
+CACHE_TTL_HISTORICAL = 7 * 24 * 60 * 60  # 7 days; annual statements change once a year
+CACHE_TTL_TREASURY = 24 * 60 * 60  # 24 hours; FRED publishes DGS10 once per business day
+CACHE_TTL_ERROR = 60  # 1 minute before retrying a failed fetch
 
 # Default DCF assumptions
 DEFAULT_EQUITY_RISK_PREMIUM = 0.055  # 5.5%
@@ -3,31 +3,31 @@
 from pathlib import Path
 
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 
 from . import config
 
 
+TITLE_FONT = Font(bold=True, size=14)
+
+
 def create_base_template():
     """Create a pre-formatted base DCF template."""
-    wb = Workbook()
+    # Write-only workbooks stream rows straight to disk and start empty
+    wb = Workbook(write_only=True)
 
-    # Remove default sheet
-    del wb["Sheet"]
-
-    # Create all sheets with basic formatting
+    # Create all sheets with basic formatting (Dashboard first, so active)
     for sheet_name in config.SHEET_NAMES:
         ws = wb.create_sheet(sheet_name)
 
-        # Set column A width for all sheets
+        # Set column A width for all sheets (must precede the first append)
         ws.column_dimensions["A"].width = 25
 
         # Add sheet title
-        ws["A1"] = sheet_name.upper()
-        ws["A1"].font = Font(bold=True, size=14)
-
-    # Set Dashboard as active
-    wb.active = wb["Dashboard"]
+        title = WriteOnlyCell(ws, value=sheet_name.upper())
+        title.font = TITLE_FONT
+        ws.append([title])
 
     # Save template
     output_path = config.BASE_TEMPLATE_PATH
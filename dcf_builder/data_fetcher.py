@@ -1,60 +1,147 @@
 """Data fetching with caching for market data, financials, and treasury rates."""
 
-import json
+import atexit
+import datetime
+import pickle
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Any, Optional
-
-import pandas as pd
-import yfinance as yf
-from fredapi import Fred
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from . import config
 
+# pandas, yfinance and fredapi are imported where they are first used, so
+# CLI startup and UDF module loading don't pay their import cost up front
+if TYPE_CHECKING:
+    import pandas as pd
+    import yfinance as yf
+    from fredapi import Fred
+
+# Cache key prefixes (ticker is appended) and the negative-cache suffix
+STOCK_INFO_PREFIX = "stock_info_"
+FINANCIALS_PREFIX = "financials_"
+RISK_FREE_KEY = "risk_free_rate"
+ERROR_SUFFIX = ":err"
+
+# Result field -> yfinance statement row label
+INCOME_STATEMENT_ROWS = {
+    "revenue": "Total Revenue",
+    "gross_profit": "Gross Profit",
+    "ebitda": "EBITDA",
+    "ebit": "EBIT",
+    "net_income": "Net Income",
+}
+BALANCE_SHEET_ROWS = {
+    "total_assets": "Total Assets",
+    "total_liabilities": "Total Liabilities Net Minority Interest",
+    "total_equity": "Total Equity Gross Minority Interest",
+    "cash": "Cash And Cash Equivalents",
+    "total_debt": "Total Debt",
+}
+
 
 class Cache:
-    """Simple JSON file cache with TTL support."""
+    """SQLite-backed key-value cache with TTL support."""
 
     def __init__(self, cache_dir: Path = config.CACHE_DIR):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "cache.json"
-        self._cache = self._load_cache()
-
-    def _load_cache(self) -> dict:
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                return {}
-        return {}
-
-    def _save_cache(self) -> None:
-        with open(self.cache_file, "w") as f:
-            json.dump(self._cache, f, indent=2, default=str)
-
-    def get(self, key: str, ttl: int) -> Optional[Any]:
+        self.cache_file = self.cache_dir / "cache.sqlite"
+        self._conn = sqlite3.connect(str(self.cache_file), check_same_thread=False)
+        # WAL lets flushes append without rewriting pages, and NORMAL skips the
+        # fsync per commit; losing the last batch on power loss is fine for a cache
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        # Read pages straight from the OS page cache, which every UDF server
+        # process opening this file shares, instead of copying them in
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (k TEXT PRIMARY KEY, v BLOB, ts REAL)"
+        )
+        self._conn.commit()
+        self._pending: Dict[str, Tuple[bytes, float]] = {}
+        self._memory: "OrderedDict[str, Tuple[Any, float]]" = OrderedDict()
+        self.flush_threshold = 16
+        self.memory_size = 256
+        # Guards the connection and both tiers; DataFetcher fetches concurrently
+        self._lock = threading.RLock()
+
+    def get(self, key: str, ttl: float) -> Optional[Any]:
         """Get cached value if not expired."""
-        if key in self._cache:
-            entry = self._cache[key]
-            if time.time() - entry["timestamp"] < ttl:
-                return entry["value"]
-        return None
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                row = self._pending.get(key) or self._conn.execute(
+                    "SELECT v, ts FROM entries WHERE k = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                # Keep the decoded value so repeat reads skip SQLite and unpickling
+                entry = (pickle.loads(row[0]), row[1])
+                self._remember(key, entry)
+            else:
+                self._memory.move_to_end(key)
+            if time.time() - entry[1] < ttl:
+                return entry[0]
+            return None
+
+    def get_any(self, key: str) -> Optional[Any]:
+        """Get cached value regardless of age, for serving stale data on errors."""
+        return self.get(key, float("inf"))
 
     def set(self, key: str, value: Any) -> None:
-        """Cache a value with current timestamp."""
-        self._cache[key] = {"value": value, "timestamp": time.time()}
-        self._save_cache()
+        """Cache a value with current timestamp.
+
+        Writes are buffered and flushed to disk in batches; call flush() to
+        persist them immediately.
+        """
+        with self._lock:
+            now = time.time()
+            self._remember(key, (value, now))
+            self._pending[key] = (pickle.dumps(value, pickle.HIGHEST_PROTOCOL), now)
+            if len(self._pending) >= self.flush_threshold:
+                self.flush()
+
+    def _remember(self, key: str, entry: Tuple[Any, float]) -> None:
+        """Add a decoded entry to the in-memory LRU tier."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def flush(self) -> None:
+        """Write buffered entries to disk."""
+        with self._lock:
+            if not self._pending:
+                return
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (k, v, ts) VALUES (?, ?, ?)",
+                [(k, v, ts) for k, (v, ts) in self._pending.items()],
+            )
+            self._conn.commit()
+            self._pending.clear()
+
+    def close(self) -> None:
+        """Flush buffered entries and close the database connection."""
+        with self._lock:
+            self.flush()
+            self._conn.close()
 
     def clear(self) -> None:
         """Clear all cached data."""
-        self._cache = {}
-        self._save_cache()
+        with self._lock:
+            self._pending.clear()
+            self._memory.clear()
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
 
 
-# Global cache instance
+# Global cache instance, flushed on interpreter exit
 _cache = Cache()
+atexit.register(_cache.flush)
 
 
 class DataFetcher:
@@ -63,47 +150,111 @@ class DataFetcher:
     def __init__(self):
         self.cache = _cache
         self._fred = None
+        self._tickers: Dict[str, Tuple[float, Any]] = {}
+        self._tickers_lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_locks_guard = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=4)
 
     @property
-    def fred(self) -> Fred:
+    def fred(self) -> "Fred":
         """Lazy-load FRED client."""
         if self._fred is None:
+            from fredapi import Fred
+
             self._fred = Fred(api_key=config.FRED_API_KEY)
         return self._fred
 
+    def _get_ticker(self, ticker: str) -> "yf.Ticker":
+        """Reuse yfinance Ticker objects for the market-data TTL."""
+        import yfinance as yf
+
+        with self._tickers_lock:
+            entry = self._tickers.get(ticker)
+            now = time.monotonic()
+            if entry is None or now - entry[0] >= config.CACHE_TTL_MARKET_DATA:
+                entry = (now, yf.Ticker(ticker))
+                self._tickers[ticker] = entry
+            return entry[1]
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        """Get the lock serializing fetches for one cache key."""
+        with self._key_locks_guard:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def prefetch(self, tickers: List[str]) -> None:
+        """Warm the cache for several tickers with one batched Ticker build."""
+        import yfinance as yf
+
+        batch = yf.Tickers(" ".join(tickers))
+        now = time.monotonic()
+        with self._tickers_lock:
+            for symbol, stock in batch.tickers.items():
+                self._tickers[symbol] = (now, stock)
+
+        # Errors stay in the futures for the caller that actually needs the data
+        submit = self._executor.submit
+        futures = [submit(self.get_risk_free_rate)]
+        for symbol in batch.tickers:
+            futures.append(submit(self.get_stock_info, symbol))
+            futures.append(submit(self.get_historical_financials, symbol))
+        wait(futures)
+
+    def warm(self, ticker: str) -> None:
+        """Fetch a ticker's info, financials and the risk-free rate concurrently."""
+        wait([
+            self._executor.submit(self.get_stock_info, ticker),
+            self._executor.submit(self.get_historical_financials, ticker),
+            self._executor.submit(self.get_risk_free_rate),
+        ])
+
     def get_stock_info(self, ticker: str) -> dict:
         """Get basic stock info (price, market cap, beta, etc.)."""
-        cache_key = f"stock_info_{ticker}"
+        cache_key = STOCK_INFO_PREFIX + ticker
         cached = self.cache.get(cache_key, config.CACHE_TTL_MARKET_DATA)
         if cached:
             return cached
 
-        try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
-            result = {
-                "price": info.get("currentPrice") or info.get("regularMarketPrice"),
-                "market_cap": info.get("marketCap"),
-                "beta": info.get("beta"),
-                "shares_outstanding": info.get("sharesOutstanding"),
-                "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
-                "fifty_two_week_low": info.get("fiftyTwoWeekLow"),
-                "enterprise_value": info.get("enterpriseValue"),
-                "trailing_pe": info.get("trailingPE"),
-                "forward_pe": info.get("forwardPE"),
-                "dividend_yield": info.get("dividendYield"),
-                "name": info.get("longName") or info.get("shortName"),
-                "sector": info.get("sector"),
-                "industry": info.get("industry"),
-            }
-            self.cache.set(cache_key, result)
-            return result
-        except Exception as e:
-            # Return cached value even if expired, or empty dict
-            expired = self.cache._cache.get(cache_key, {}).get("value", {})
-            if expired:
-                return expired
-            raise RuntimeError(f"Failed to fetch data for {ticker}: {e}")
+        # Concurrent UDF calls for one ticker share a single .info request
+        with self._key_lock(cache_key):
+            cached = self.cache.get(cache_key, config.CACHE_TTL_MARKET_DATA)
+            if cached:
+                return cached
+            return self._fetch_stock_info(ticker, cache_key)
+
+    def _fetch_stock_info(self, ticker: str, cache_key: str) -> dict:
+        """Download and cache stock info, falling back to stale data."""
+        error = self.cache.get(cache_key + ERROR_SUFFIX, config.CACHE_TTL_ERROR)
+        if error is None:
+            try:
+                stock = self._get_ticker(ticker)
+                info = stock.info
+                result = {
+                    "price": info.get("currentPrice") or info.get("regularMarketPrice"),
+                    "market_cap": info.get("marketCap"),
+                    "beta": info.get("beta"),
+                    "shares_outstanding": info.get("sharesOutstanding"),
+                    "fifty_two_week_high": info.get("fiftyTwoWeekHigh"),
+                    "fifty_two_week_low": info.get("fiftyTwoWeekLow"),
+                    "enterprise_value": info.get("enterpriseValue"),
+                    "trailing_pe": info.get("trailingPE"),
+                    "forward_pe": info.get("forwardPE"),
+                    "dividend_yield": info.get("dividendYield"),
+                    "name": info.get("longName") or info.get("shortName"),
+                    "sector": info.get("sector"),
+                    "industry": info.get("industry"),
+                }
+                self.cache.set(cache_key, result)
+                return result
+            except Exception as e:
+                error = str(e)
+                self.cache.set(cache_key + ERROR_SUFFIX, error)
+
+        # Return cached value even if expired, or raise
+        expired = self.cache.get_any(cache_key)
+        if expired:
+            return expired
+        raise RuntimeError(f"Failed to fetch data for {ticker}: {error}")
 
     def get_price(self, ticker: str) -> Optional[float]:
         """Get current stock price."""
@@ -132,95 +283,105 @@ class DataFetcher:
 
     def get_risk_free_rate(self) -> Optional[float]:
         """Get current 10-year Treasury rate from FRED."""
-        cache_key = "risk_free_rate"
+        cache_key = RISK_FREE_KEY
         cached = self.cache.get(cache_key, config.CACHE_TTL_TREASURY)
         if cached is not None:
             return cached
 
-        try:
-            # DGS10 is the 10-Year Treasury Constant Maturity Rate
-            data = self.fred.get_series("DGS10")
-            # Get most recent non-null value
-            rate = data.dropna().iloc[-1] / 100  # Convert from percent
-            self.cache.set(cache_key, rate)
-            return rate
-        except Exception as e:
-            # Return cached value even if expired, or default
-            expired = self.cache._cache.get(cache_key, {}).get("value")
-            if expired is not None:
-                return expired
-            # Fallback to reasonable default
-            return 0.04  # 4%
+        with self._key_lock(cache_key):
+            cached = self.cache.get(cache_key, config.CACHE_TTL_TREASURY)
+            if cached is not None:
+                return cached
+            return self._fetch_risk_free_rate(cache_key)
+
+    def _fetch_risk_free_rate(self, cache_key: str) -> float:
+        """Download and cache the rate, falling back to stale data or 4%."""
+        error = self.cache.get(cache_key + ERROR_SUFFIX, config.CACHE_TTL_ERROR)
+        if error is None:
+            try:
+                # DGS10 is the 10-Year Treasury Constant Maturity Rate; only
+                # the recent window is needed, not the series back to 1962
+                start = datetime.date.today() - datetime.timedelta(days=30)
+                data = self.fred.get_series("DGS10", observation_start=start)
+                # Most recent non-null value, converted from percent and
+                # stored as a plain float rather than a numpy scalar
+                rate = float(data.dropna().iloc[-1]) / 100
+                self.cache.set(cache_key, rate)
+                return rate
+            except Exception as e:
+                self.cache.set(cache_key + ERROR_SUFFIX, str(e))
+
+        # Return cached value even if expired, or default
+        expired = self.cache.get_any(cache_key)
+        if expired is not None:
+            return expired
+        # Fallback to reasonable default
+        return 0.04  # 4%
 
     def get_historical_financials(self, ticker: str) -> dict:
         """Get 5 years of historical financials from yfinance."""
-        cache_key = f"financials_{ticker}"
+        cache_key = FINANCIALS_PREFIX + ticker
         cached = self.cache.get(cache_key, config.CACHE_TTL_HISTORICAL)
         if cached:
             return cached
 
-        try:
-            stock = yf.Ticker(ticker)
-
-            # Get income statement
-            income_stmt = stock.financials
-            # Get balance sheet
-            balance_sheet = stock.balance_sheet
-
-            result = {"income_statement": {}, "balance_sheet": {}, "years": []}
-
-            if income_stmt is not None and not income_stmt.empty:
-                # yfinance returns columns as dates
-                years = [col.year for col in income_stmt.columns[:5]]
-                result["years"] = years
-
-                for col in income_stmt.columns[:5]:
-                    year = col.year
-                    result["income_statement"][year] = {
-                        "revenue": self._safe_get(income_stmt, "Total Revenue", col),
-                        "gross_profit": self._safe_get(income_stmt, "Gross Profit", col),
-                        "ebitda": self._safe_get(income_stmt, "EBITDA", col),
-                        "ebit": self._safe_get(income_stmt, "EBIT", col),
-                        "net_income": self._safe_get(income_stmt, "Net Income", col),
-                    }
-
-            if balance_sheet is not None and not balance_sheet.empty:
-                for col in balance_sheet.columns[:5]:
-                    year = col.year
-                    if year not in result["income_statement"]:
-                        result["income_statement"][year] = {}
-                    result["balance_sheet"][year] = {
-                        "total_assets": self._safe_get(balance_sheet, "Total Assets", col),
-                        "total_liabilities": self._safe_get(
-                            balance_sheet, "Total Liabilities Net Minority Interest", col
-                        ),
-                        "total_equity": self._safe_get(
-                            balance_sheet, "Total Equity Gross Minority Interest", col
-                        ),
-                        "cash": self._safe_get(
-                            balance_sheet, "Cash And Cash Equivalents", col
-                        ),
-                        "total_debt": self._safe_get(balance_sheet, "Total Debt", col),
-                    }
-
-            self.cache.set(cache_key, result)
-            return result
-        except Exception as e:
-            expired = self.cache._cache.get(cache_key, {}).get("value", {})
-            if expired:
-                return expired
-            raise RuntimeError(f"Failed to fetch financials for {ticker}: {e}")
-
-    def _safe_get(self, df: pd.DataFrame, row: str, col) -> Optional[float]:
-        """Safely get a value from a DataFrame."""
-        try:
-            if row in df.index:
-                val = df.loc[row, col]
-                if pd.notna(val):
-                    return float(val)
-        except (KeyError, TypeError):
-            pass
-        return None
+        # Only one full download per ticker at a time: concurrent recalcs
+        # wait for it and then read the result from the cache
+        with self._key_lock(cache_key):
+            cached = self.cache.get(cache_key, config.CACHE_TTL_HISTORICAL)
+            if cached:
+                return cached
+            return self._fetch_historical_financials(ticker, cache_key)
+
+    def _fetch_historical_financials(self, ticker: str, cache_key: str) -> dict:
+        """Download and cache financials, falling back to stale data."""
+        error = self.cache.get(cache_key + ERROR_SUFFIX, config.CACHE_TTL_ERROR)
+        if error is None:
+            try:
+                stock = self._get_ticker(ticker)
+
+                # Get income statement
+                income_stmt = stock.financials
+                # Get balance sheet
+                balance_sheet = stock.balance_sheet
+
+                result = {"income_statement": {}, "balance_sheet": {}, "years": []}
+
+                if income_stmt is not None and not income_stmt.empty:
+                    # yfinance returns columns as dates
+                    years = [col.year for col in income_stmt.columns[:5]]
+                    result["years"] = years
+
+                    result["income_statement"] = self._statement_by_year(
+                        income_stmt, INCOME_STATEMENT_ROWS
+                    )
+
+                if balance_sheet is not None and not balance_sheet.empty:
+                    result["balance_sheet"] = self._statement_by_year(
+                        balance_sheet, BALANCE_SHEET_ROWS
+                    )
+                    for year in result["balance_sheet"]:
+                        result["income_statement"].setdefault(year, {})
+
+                self.cache.set(cache_key, result)
+                return result
+            except Exception as e:
+                error = str(e)
+                self.cache.set(cache_key + ERROR_SUFFIX, error)
+
+        expired = self.cache.get_any(cache_key)
+        if expired:
+            return expired
+        raise RuntimeError(f"Failed to fetch financials for {ticker}: {error}")
+
+    @staticmethod
+    def _statement_by_year(df: "pd.DataFrame", rows: Dict[str, str]) -> Dict[int, dict]:
+        """Map the latest five fiscal years of a statement to {field: value}."""
+        df = df[~df.index.duplicated()]
+        sub = df.reindex(list(rows.values())).iloc[:, :5].astype(float)
+        sub.index = list(rows)
+        sub = sub.astype(object).where(sub.notna(), None)
+        return {col.year: values for col, values in sub.to_dict().items()}
 
     def get_revenue(self, ticker: str, year: int) -> Optional[float]:
         """Get revenue for a specific year."""
@@ -239,12 +400,29 @@ class DataFetcher:
         tax_rate: float = config.DEFAULT_TAX_RATE,
     ) -> Optional[float]:
         """Calculate WACC for a company."""
-        info = self.get_stock_info(ticker)
-        financials = self.get_historical_financials(ticker)
+        inputs = (
+            (STOCK_INFO_PREFIX + ticker, config.CACHE_TTL_MARKET_DATA),
+            (FINANCIALS_PREFIX + ticker, config.CACHE_TTL_HISTORICAL),
+            (RISK_FREE_KEY, config.CACHE_TTL_TREASURY),
+        )
+        if all(self.cache.get(key, ttl) is not None for key, ttl in inputs):
+            # Warm cache (the usual Excel recalc case): thread handoffs
+            # would cost far more than the lookups themselves
+            info = self.get_stock_info(ticker)
+            financials = self.get_historical_financials(ticker)
+            risk_free = self.get_risk_free_rate()
+        else:
+            # The three inputs are independent network fetches on a cold cache
+            submit = self._executor.submit
+            info_future = submit(self.get_stock_info, ticker)
+            financials_future = submit(self.get_historical_financials, ticker)
+            risk_free_future = submit(self.get_risk_free_rate)
+            info = info_future.result()
+            financials = financials_future.result()
+            risk_free = risk_free_future.result()
 
         beta = info.get("beta")
         market_cap = info.get("market_cap")
-        risk_free = self.get_risk_free_rate()
 
         if beta is None or market_cap is None or risk_free is None:
             return None
@@ -334,5 +512,18 @@ def calculate_wacc(
     return _fetcher.calculate_wacc(ticker, cost_of_debt, tax_rate)
 
 
+def prefetch(tickers: List[str]) -> None:
+    _fetcher.prefetch(tickers)
+
+
+def warm(ticker: str) -> None:
+    _fetcher.warm(ticker)
+
+
+def flush_cache() -> None:
+    _fetcher.cache.flush()
+
+
 def clear_cache() -> None:
     _fetcher.cache.clear()
+    _fetcher._tickers.clear()
@@ -11,11 +11,21 @@ Usage in Excel (after xlwings setup):
     =DCF_REVENUE("AAPL", 2023)
 """
 
+import sys
 from typing import Optional, Union
 
 from . import data_fetcher as df
 
 
+def _symbol(ticker: str) -> str:
+    """Normalize a ticker argument to an interned upper-case symbol.
+
+    Interning lets the many UDF calls for one ticker in a recalc share a
+    single string object for the cache-key lookups downstream.
+    """
+    return sys.intern(ticker.upper())
+
+
 def DCF_PRICE(ticker: str) -> Optional[float]:
     """Get current stock price.
 
@@ -26,7 +36,7 @@ def DCF_PRICE(ticker: str) -> Optional[float]:
         Current stock price or None if unavailable
     """
     try:
-        return df.get_price(ticker.upper())
+        return df.get_price(_symbol(ticker))
     except Exception:
         return None
 
@@ -41,7 +51,7 @@ def DCF_MARKET_CAP(ticker: str) -> Optional[float]:
         Market cap in millions or None if unavailable
     """
     try:
-        return df.get_market_cap(ticker.upper())
+        return df.get_market_cap(_symbol(ticker))
     except Exception:
         return None
 
@@ -56,7 +66,7 @@ def DCF_BETA(ticker: str) -> Optional[float]:
         Beta or None if unavailable
     """
     try:
-        return df.get_beta(ticker.upper())
+        return df.get_beta(_symbol(ticker))
     except Exception:
         return None
 
@@ -71,7 +81,7 @@ def DCF_SHARES_OUT(ticker: str) -> Optional[float]:
         Shares outstanding or None if unavailable
     """
     try:
-        return df.get_shares_outstanding(ticker.upper())
+        return df.get_shares_outstanding(_symbol(ticker))
     except Exception:
         return None
 
@@ -86,7 +96,7 @@ def DCF_52W_HIGH(ticker: str) -> Optional[float]:
         52-week high price or None if unavailable
     """
     try:
-        return df.get_52_week_high(ticker.upper())
+        return df.get_52_week_high(_symbol(ticker))
     except Exception:
         return None
 
@@ -101,7 +111,7 @@ def DCF_52W_LOW(ticker: str) -> Optional[float]:
         52-week low price or None if unavailable
     """
     try:
-        return df.get_52_week_low(ticker.upper())
+        return df.get_52_week_low(_symbol(ticker))
     except Exception:
         return None
 
@@ -129,7 +139,7 @@ def DCF_REVENUE(ticker: str, year: Union[int, float]) -> Optional[float]:
         Revenue in dollars or None if unavailable
     """
     try:
-        return df.get_revenue(ticker.upper(), int(year))
+        return df.get_revenue(_symbol(ticker), int(year))
     except Exception:
         return None
 
@@ -145,7 +155,7 @@ def DCF_EBITDA(ticker: str, year: Union[int, float]) -> Optional[float]:
         EBITDA in dollars or None if unavailable
     """
     try:
-        return df.get_ebitda(ticker.upper(), int(year))
+        return df.get_ebitda(_symbol(ticker), int(year))
     except Exception:
         return None
 
@@ -160,7 +170,7 @@ def DCF_WACC(ticker: str) -> Optional[float]:
         WACC as decimal (e.g., 0.10 for 10%)
     """
     try:
-        return df.calculate_wacc(ticker.upper())
+        return df.calculate_wacc(_symbol(ticker))
     except Exception:
         return None
 
@@ -175,7 +185,7 @@ def DCF_EV(ticker: str) -> Optional[float]:
         Enterprise value or None if unavailable
     """
     try:
-        info = df.get_stock_info(ticker.upper())
+        info = df.get_stock_info(_symbol(ticker))
         return info.get("enterprise_value")
     except Exception:
         return None
@@ -191,7 +201,7 @@ def DCF_PE(ticker: str) -> Optional[float]:
         Trailing P/E ratio or None if unavailable
     """
     try:
-        info = df.get_stock_info(ticker.upper())
+        info = df.get_stock_info(_symbol(ticker))
         return info.get("trailing_pe")
     except Exception:
         return None
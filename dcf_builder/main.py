@@ -28,18 +28,21 @@ from .template_generator import generate_dcf_model
 from . import excel_functions
 
 
-def generate_dcf(ticker: str, output_path: Optional[str] = None) -> Path:
+def generate_dcf(
+    ticker: str, output_path: Optional[str] = None, mode: str = "formulas"
+) -> Path:
     """Generate a DCF model for the given ticker.
 
     Args:
         ticker: Stock ticker symbol
         output_path: Optional output file path
+        mode: "formulas" for a live model, "values" for evaluated numbers
 
     Returns:
         Path to the generated Excel file
     """
     path = Path(output_path) if output_path else None
-    return generate_dcf_model(ticker, path)
+    return generate_dcf_model(ticker, path, mode)
 
 
 def refresh_data() -> None:
@@ -81,6 +84,7 @@ if XLWINGS_AVAILABLE:
         try:
             # Generate the model
             output_path = generate_dcf_model(ticker)
+            df.flush_cache()
 
             # Open the generated workbook
             xw.Book(str(output_path))
@@ -193,6 +197,8 @@ def main():
 Examples:
   dcf-builder generate AAPL
   dcf-builder generate MSFT --output ~/Desktop/msft_dcf.xlsx
+  dcf-builder generate AAPL MSFT GOOGL
+  dcf-builder generate AAPL --values
   dcf-builder refresh
   dcf-builder price AAPL
 
@@ -205,10 +211,15 @@ Excel Integration:
 
     # Generate command
     gen_parser = subparsers.add_parser("generate", help="Generate a DCF model")
-    gen_parser.add_argument("ticker", help="Stock ticker symbol")
+    gen_parser.add_argument("tickers", nargs="+", help="Stock ticker symbol(s)")
     gen_parser.add_argument(
         "--output", "-o", help="Output file path (default: DCF_TICKER_DATE.xlsx)"
     )
+    gen_parser.add_argument(
+        "--values",
+        action="store_true",
+        help="Write evaluated numbers instead of formulas (no recalc needed)",
+    )
 
     # Refresh command
     subparsers.add_parser("refresh", help="Clear data cache")
@@ -224,9 +235,16 @@ Excel Integration:
     args = parser.parse_args()
 
     if args.command == "generate":
-        print(f"Generating DCF model for {args.ticker}...")
-        output = generate_dcf(args.ticker, args.output)
-        print(f"Model generated: {output}")
+        if len(args.tickers) > 1:
+            if args.output:
+                parser.error("--output can only be used with a single ticker")
+            df.prefetch([t.upper() for t in args.tickers])
+
+        for ticker in args.tickers:
+            print(f"Generating DCF model for {ticker}...")
+            mode = "values" if args.values else "formulas"
+            output = generate_dcf(ticker, args.output, mode)
+            print(f"Model generated: {output}")
 
     elif args.command == "refresh":
         refresh_data()
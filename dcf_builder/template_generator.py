@@ -1,19 +1,34 @@
 """Template generator for creating DCF workbooks."""
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-from openpyxl import Workbook
-from openpyxl.chart import BarChart, Reference
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
+# Prefer wolfxl (a Rust-backed, openpyxl-compatible writer) when installed
+try:
+    from wolfxl import Workbook
+    from wolfxl.chart import BarChart, Reference
+    from wolfxl.styles import Border, Font, NamedStyle, PatternFill, Side
+    from wolfxl.utils import get_column_letter
+    WOLFXL_AVAILABLE = True
+except ImportError:
+    from openpyxl import Workbook
+    from openpyxl.chart import BarChart, Reference
+    from openpyxl.styles import Border, Font, NamedStyle, PatternFill, Side
+    from openpyxl.utils import get_column_letter
+    WOLFXL_AVAILABLE = False
 
 from . import config
 from . import data_fetcher as df
 
 
-# Styles
+# Styles (shared instances, so each cell doesn't build its own style object)
+TITLE_FONT = Font(bold=True, size=18)
+SUBTITLE_FONT = Font(size=14)
+SHEET_TITLE_FONT = Font(bold=True, size=14)
+BOLD_FONT = Font(bold=True)
+BODY_FONT = Font(name="Calibri", size=11, family=2, scheme="minor")  # workbook default
 HEADER_FONT = Font(bold=True, size=12, color="FFFFFF")
 HEADER_FILL = PatternFill(start_color="4472C4", end_color="4472C4", fill_type="solid")
 SUBHEADER_FILL = PatternFill(start_color="D9E2F3", end_color="D9E2F3", fill_type="solid")
@@ -29,26 +44,119 @@ NUMBER_FORMAT_PERCENT = "0.0%"
 NUMBER_FORMAT_CURRENCY = "$#,##0.00"
 NUMBER_FORMAT_MULTIPLE = "0.0x"
 
+# Named styles registered on every workbook, applied with cell.style = name
+STYLES = {
+    "section_header": {"font": HEADER_FONT, "fill": HEADER_FILL},
+    "subsection_header": {"font": HEADER_FONT, "fill": SUBHEADER_FILL},
+    "total_label": {"font": BOLD_FONT, "fill": SUBHEADER_FILL},
+    "key_output": {
+        "font": BOLD_FONT,
+        "fill": INPUT_FILL,
+        "number_format": NUMBER_FORMAT_CURRENCY,
+    },
+    "peer_input": {"font": BODY_FONT, "fill": INPUT_FILL},
+    "sensitivity_cell": {
+        "font": BODY_FONT,
+        "fill": SUBHEADER_FILL,
+        "number_format": NUMBER_FORMAT_CURRENCY,
+    },
+}
+
+# Default inputs written to the Assumptions sheet
+COST_OF_DEBT = 0.05
+DEBT_TO_CAPITAL = 0.20
+REVENUE_GROWTH = 0.05
+EBITDA_MARGIN = 0.20
+DA_PCT_REVENUE = 0.03
+CAPEX_PCT_REVENUE = 0.04
+NWC_PCT_REVENUE = 0.10
+
+# Build modes: live Excel formulas, or their results evaluated in Python
+MODES = ("formulas", "values")
+
+# Error Excel shows for a zero divisor; values mode writes it where Excel would
+DIV_ZERO_ERROR = "#DIV/0!"
+
+# Cell holding the DCF value per share, linked from Dashboard and Football Field
+VALUE_PER_SHARE_REF = "Valuation!B21"
+
+# Column letters A..Z by zero-based index; every sheet stays well inside this
+COL_LETTERS = tuple(get_column_letter(i) for i in range(1, 27))
+
+
+def _millions(value: Optional[float]) -> Optional[float]:
+    """Scale a raw statement value to millions, leaving gaps empty."""
+    return value / 1e6 if value else None
+
 
 class DCFTemplateGenerator:
-    """Generates a complete DCF model workbook."""
+    """Generates a complete DCF model workbook.
+
+    In "values" mode the model's formulas are evaluated in Python and their
+    results written instead, so the workbook can be read without Excel
+    recalculating it.
+    """
 
-    def __init__(self, ticker: str):
+    def __init__(self, ticker: str, mode: str = "formulas"):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {MODES}, got {mode!r}")
         self.ticker = ticker.upper()
+        self.mode = mode
         self.wb = Workbook()
+        # Styled cells reference one registered style each instead of
+        # having their font, fill and number format set separately
+        for name, attrs in STYLES.items():
+            self.wb.add_named_style(NamedStyle(name, **attrs))
         self.data = {}
+        # Derived from the financials in fetch_data, for the sheet builders
+        self._sorted_years: list = []
+        self._income: dict = {}
+        self._balance: dict = {}
+        self._latest_year: Optional[int] = None
+        self._base_revenue_m = 0.0
+        # Projections sheet row of each line item, filled in by _create_projections
+        self._proj_rows: dict = {}
+        # Evaluated formula results, only filled in values mode
+        self._values: dict = {}
         self.current_year = datetime.now().year
 
     def fetch_data(self) -> None:
         """Fetch all required data for the model."""
-        self.data["info"] = df.get_stock_info(self.ticker)
-        self.data["financials"] = df.get_historical_financials(self.ticker)
-        self.data["risk_free"] = df.get_risk_free_rate()
-        self.data["wacc"] = df.calculate_wacc(self.ticker)
+        # The three downloads are independent, so overlap their latency
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            info = executor.submit(df.get_stock_info, self.ticker)
+            historical = executor.submit(df.get_historical_financials, self.ticker)
+            risk_free = executor.submit(df.get_risk_free_rate)
+
+        # A ticker without stock info can't be modelled, so that still raises;
+        # missing financials only leave the historical sections empty
+        self.data["info"] = info.result()
+        try:
+            self.data["financials"] = historical.result()
+        except RuntimeError:
+            self.data["financials"] = {"income_statement": {}, "balance_sheet": {}, "years": []}
+        self.data["risk_free"] = risk_free.result()
+
+        # Inputs are cached by now, so this doesn't touch the network
+        try:
+            self.data["wacc"] = df.calculate_wacc(self.ticker)
+        except RuntimeError:
+            self.data["wacc"] = None
+
+        # Most recent fiscal year first
+        financials = self.data["financials"]
+        self._sorted_years = sorted(financials.get("years", []), reverse=True)
+        self._income = financials.get("income_statement", {})
+        self._balance = financials.get("balance_sheet", {})
+        self._latest_year = self._sorted_years[0] if self._sorted_years else None
+        base_revenue = self._income.get(self._latest_year, {}).get("revenue") or 0
+        self._base_revenue_m = base_revenue / 1e6
 
     def generate(self, output_path: Optional[Path] = None) -> Path:
         """Generate the complete DCF workbook."""
         self.fetch_data()
+        if self.mode == "values":
+            self._values = self._evaluate()
 
         # Remove default sheet
         if "Sheet" in self.wb.sheetnames:
@@ -72,20 +180,24 @@ class DCFTemplateGenerator:
             output_path = Path.cwd() / f"DCF_{self.ticker}_{datetime.now():%Y%m%d}.xlsx"
 
         self.wb.save(output_path)
+        # Release the writer here rather than whenever the garbage collector
+        # reaches it: wolfxl's native workbook must be freed on this thread,
+        # and collection may otherwise run on one of the fetch workers
+        self.wb.close()
         return output_path
 
     def _create_dashboard(self) -> None:
         """Create executive dashboard sheet."""
         ws = self.wb.create_sheet("Dashboard")
+        info = self.data["info"]
+        market_cap = info.get("market_cap")
 
         # Title section
-        ws.merge_cells("A1:H1")
-        ws["A1"] = f"{self.data['info'].get('name', self.ticker)} ({self.ticker})"
-        ws["A1"].font = Font(bold=True, size=18)
+        ws["A1"] = f"{info.get('name', self.ticker)} ({self.ticker})"
+        ws["A1"].font = TITLE_FONT
 
-        ws.merge_cells("A2:H2")
         ws["A2"] = "DCF Valuation Analysis"
-        ws["A2"].font = Font(size=14)
+        ws["A2"].font = SUBTITLE_FONT
 
         ws["A3"] = f"Generated: {datetime.now():%Y-%m-%d}"
         ws["F3"] = "Scenario:"
@@ -94,17 +206,15 @@ class DCFTemplateGenerator:
 
         # Key Metrics section
         ws["A5"] = "KEY METRICS"
-        ws["A5"].font = HEADER_FONT
-        ws["A5"].fill = HEADER_FILL
-        ws.merge_cells("A5:C5")
+        ws["A5"].style = "section_header"
 
         metrics = [
-            ("Current Price", self.data["info"].get("price"), NUMBER_FORMAT_CURRENCY),
-            ("Market Cap (M)", self.data["info"].get("market_cap", 0) / 1e6 if self.data["info"].get("market_cap") else None, NUMBER_FORMAT_MILLIONS),
+            ("Current Price", info.get("price"), NUMBER_FORMAT_CURRENCY),
+            ("Market Cap (M)", market_cap / 1e6 if market_cap else None, NUMBER_FORMAT_MILLIONS),
             ("EV/EBITDA", None, NUMBER_FORMAT_MULTIPLE),  # Calculated later
-            ("Beta", self.data["info"].get("beta"), "0.00"),
-            ("52-Week High", self.data["info"].get("fifty_two_week_high"), NUMBER_FORMAT_CURRENCY),
-            ("52-Week Low", self.data["info"].get("fifty_two_week_low"), NUMBER_FORMAT_CURRENCY),
+            ("Beta", info.get("beta"), "0.00"),
+            ("52-Week High", info.get("fifty_two_week_high"), NUMBER_FORMAT_CURRENCY),
+            ("52-Week Low", info.get("fifty_two_week_low"), NUMBER_FORMAT_CURRENCY),
         ]
 
         for i, (label, value, fmt) in enumerate(metrics, start=6):
@@ -114,20 +224,20 @@ class DCFTemplateGenerator:
 
         # Valuation Summary section
         ws["E5"] = "VALUATION SUMMARY"
-        ws["E5"].font = HEADER_FONT
-        ws["E5"].fill = HEADER_FILL
-        ws.merge_cells("E5:G5")
+        ws["E5"].style = "section_header"
 
         ws["E6"] = "DCF Value per Share"
-        ws["F6"] = "=Valuation!E20"  # Link to valuation sheet
+        ws["F6"] = self._formula(f"={VALUE_PER_SHARE_REF}", "value_per_share")
 
         ws["E7"] = "Current Price"
-        ws["F7"] = f"=B6"
+        ws["F7"] = self._formula("=B6", "price")
 
         ws["E8"] = "Implied Upside"
-        ws["F8"] = "=IF(F7>0,(F6-F7)/F7,0)"
+        ws["F8"] = self._formula("=IF(F7>0,(F6-F7)/F7,0)", "upside")
         ws["F8"].number_format = NUMBER_FORMAT_PERCENT
 
+        self._merge(ws, ["A1:H1", "A2:H2", "A5:C5", "E5:G5"])
+
         # Column widths
         for col in ["A", "B", "C", "E", "F", "G"]:
             ws.column_dimensions[col].width = 18
@@ -135,11 +245,11 @@ class DCFTemplateGenerator:
     def _create_assumptions(self) -> None:
         """Create assumptions input sheet."""
         ws = self.wb.create_sheet("Assumptions")
+        info = self.data["info"]
 
         # Header
         ws["A1"] = "DCF MODEL ASSUMPTIONS"
-        ws["A1"].font = Font(bold=True, size=14)
-        ws.merge_cells("A1:D1")
+        ws["A1"].font = SHEET_TITLE_FONT
 
         # Scenario selector
         ws["A3"] = "Scenario"
@@ -148,27 +258,23 @@ class DCFTemplateGenerator:
 
         # Company info
         ws["A5"] = "COMPANY INFORMATION"
-        ws["A5"].font = HEADER_FONT
-        ws["A5"].fill = HEADER_FILL
-        ws.merge_cells("A5:D5")
+        ws["A5"].style = "section_header"
 
         ws["A6"] = "Ticker"
         ws["B6"] = self.ticker
 
         ws["A7"] = "Company Name"
-        ws["B7"] = self.data["info"].get("name", "")
+        ws["B7"] = info.get("name", "")
 
         # Market data
         ws["A9"] = "MARKET DATA"
-        ws["A9"].font = HEADER_FONT
-        ws["A9"].fill = HEADER_FILL
-        ws.merge_cells("A9:D9")
+        ws["A9"].style = "section_header"
 
         market_data = [
-            ("Current Price", self.data["info"].get("price")),
-            ("Shares Outstanding (M)", (self.data["info"].get("shares_outstanding") or 0) / 1e6),
-            ("Market Cap (M)", (self.data["info"].get("market_cap") or 0) / 1e6),
-            ("Beta", self.data["info"].get("beta")),
+            ("Current Price", info.get("price")),
+            ("Shares Outstanding (M)", (info.get("shares_outstanding") or 0) / 1e6),
+            ("Market Cap (M)", (info.get("market_cap") or 0) / 1e6),
+            ("Beta", info.get("beta")),
             ("Risk-Free Rate", self.data["risk_free"]),
         ]
 
@@ -179,43 +285,40 @@ class DCFTemplateGenerator:
 
         # WACC Inputs
         ws["A16"] = "WACC INPUTS"
-        ws["A16"].font = HEADER_FONT
-        ws["A16"].fill = HEADER_FILL
-        ws.merge_cells("A16:D16")
+        ws["A16"].style = "section_header"
 
         wacc_inputs = [
             ("Risk-Free Rate", self.data["risk_free"], NUMBER_FORMAT_PERCENT),
             ("Equity Risk Premium", config.DEFAULT_EQUITY_RISK_PREMIUM, NUMBER_FORMAT_PERCENT),
-            ("Beta", self.data["info"].get("beta"), "0.00"),
-            ("Cost of Equity", "=B17+B18*B19", NUMBER_FORMAT_PERCENT),
-            ("Cost of Debt (pre-tax)", 0.05, NUMBER_FORMAT_PERCENT),
+            ("Beta", info.get("beta"), "0.00"),
+            ("Cost of Equity", self._formula("=B17+B18*B19", "cost_of_equity"), NUMBER_FORMAT_PERCENT),
+            ("Cost of Debt (pre-tax)", COST_OF_DEBT, NUMBER_FORMAT_PERCENT),
             ("Tax Rate", config.DEFAULT_TAX_RATE, NUMBER_FORMAT_PERCENT),
-            ("Cost of Debt (after-tax)", "=B21*(1-B22)", NUMBER_FORMAT_PERCENT),
-            ("Debt/Total Capital", 0.20, NUMBER_FORMAT_PERCENT),
-            ("Equity/Total Capital", "=1-B24", NUMBER_FORMAT_PERCENT),
-            ("WACC", "=B20*B25+B23*B24", NUMBER_FORMAT_PERCENT),
+            ("Cost of Debt (after-tax)", self._formula("=B21*(1-B22)", "cost_of_debt"), NUMBER_FORMAT_PERCENT),
+            ("Debt/Total Capital", DEBT_TO_CAPITAL, NUMBER_FORMAT_PERCENT),
+            ("Equity/Total Capital", self._formula("=1-B24", "equity_weight"), NUMBER_FORMAT_PERCENT),
+            ("WACC", self._formula("=B20*B25+B23*B24", "wacc"), NUMBER_FORMAT_PERCENT),
         ]
+        computed = {"Cost of Equity", "Cost of Debt (after-tax)", "Equity/Total Capital", "WACC"}
 
         for i, (label, value, fmt) in enumerate(wacc_inputs, start=17):
             ws[f"A{i}"] = label
             ws[f"B{i}"] = value
-            if isinstance(value, (int, float)):
+            if isinstance(value, (int, float)) and label not in computed:
                 ws[f"B{i}"].fill = INPUT_FILL
             ws[f"B{i}"].number_format = fmt
 
         # Projection assumptions
         ws["A28"] = "PROJECTION ASSUMPTIONS"
-        ws["A28"].font = HEADER_FONT
-        ws["A28"].fill = HEADER_FILL
-        ws.merge_cells("A28:D28")
+        ws["A28"].style = "section_header"
 
         proj_assumptions = [
             ("Projection Years", config.DEFAULT_PROJECTION_YEARS, "0"),
-            ("Revenue Growth Rate", 0.05, NUMBER_FORMAT_PERCENT),
-            ("EBITDA Margin", 0.20, NUMBER_FORMAT_PERCENT),
-            ("D&A % of Revenue", 0.03, NUMBER_FORMAT_PERCENT),
-            ("CapEx % of Revenue", 0.04, NUMBER_FORMAT_PERCENT),
-            ("NWC % of Revenue", 0.10, NUMBER_FORMAT_PERCENT),
+            ("Revenue Growth Rate", REVENUE_GROWTH, NUMBER_FORMAT_PERCENT),
+            ("EBITDA Margin", EBITDA_MARGIN, NUMBER_FORMAT_PERCENT),
+            ("D&A % of Revenue", DA_PCT_REVENUE, NUMBER_FORMAT_PERCENT),
+            ("CapEx % of Revenue", CAPEX_PCT_REVENUE, NUMBER_FORMAT_PERCENT),
+            ("NWC % of Revenue", NWC_PCT_REVENUE, NUMBER_FORMAT_PERCENT),
             ("Terminal Growth Rate", config.DEFAULT_TERMINAL_GROWTH, NUMBER_FORMAT_PERCENT),
         ]
 
@@ -225,6 +328,8 @@ class DCFTemplateGenerator:
             ws[f"B{i}"].fill = INPUT_FILL
             ws[f"B{i}"].number_format = fmt
 
+        self._merge(ws, ["A1:D1", "A5:D5", "A9:D9", "A16:D16", "A28:D28"])
+
         # Column widths
         ws.column_dimensions["A"].width = 25
         ws.column_dimensions["B"].width = 15
@@ -234,10 +339,9 @@ class DCFTemplateGenerator:
         ws = self.wb.create_sheet("Historical")
 
         ws["A1"] = "HISTORICAL FINANCIALS"
-        ws["A1"].font = Font(bold=True, size=14)
+        ws["A1"].font = SHEET_TITLE_FONT
 
-        financials = self.data["financials"]
-        years = sorted(financials.get("years", []), reverse=True)[:5]
+        years = self._sorted_years[:5]
 
         if not years:
             ws["A3"] = "No historical data available"
@@ -245,13 +349,14 @@ class DCFTemplateGenerator:
 
         # Headers
         ws["A3"] = "Income Statement"
-        ws["A3"].font = HEADER_FONT
-        ws["A3"].fill = HEADER_FILL
-        for i, year in enumerate(years):
-            col = get_column_letter(i + 2)
+        ws["A3"].style = "section_header"
+        cols = COL_LETTERS[1:len(years) + 1]
+        income_rows = [self._income.get(year, {}) for year in years]
+        balance_rows = [self._balance.get(year, {}) for year in years]
+
+        for year, col in zip(years, cols):
             ws[f"{col}3"] = year
-            ws[f"{col}3"].font = HEADER_FONT
-            ws[f"{col}3"].fill = HEADER_FILL
+            ws[f"{col}3"].style = "section_header"
 
         # Income statement items
         income_items = [
@@ -262,28 +367,25 @@ class DCFTemplateGenerator:
             ("Net Income", "net_income"),
         ]
 
-        row = 4
-        for label, key in income_items:
-            ws[f"A{row}"] = label
-            for i, year in enumerate(years):
-                col = get_column_letter(i + 2)
-                value = financials.get("income_statement", {}).get(year, {}).get(key)
-                ws[f"{col}{row}"] = value / 1e6 if value else None
-                ws[f"{col}{row}"].number_format = NUMBER_FORMAT_MILLIONS
-            row += 1
+        # Written a row at a time below the year headers (row 4 onwards)
+        self._append_rows(
+            ws,
+            [[label] + [_millions(yr_data.get(key)) for yr_data in income_rows]
+             for label, key in income_items],
+            [NUMBER_FORMAT_MILLIONS] * len(income_items),
+        )
+        row = 4 + len(income_items)
 
         # Growth rates
         row += 1
         ws[f"A{row}"] = "Growth Rates"
-        ws[f"A{row}"].font = HEADER_FONT
-        ws[f"A{row}"].fill = SUBHEADER_FILL
+        ws[f"A{row}"].style = "subsection_header"
         row += 1
 
         ws[f"A{row}"] = "Revenue Growth"
-        for i, year in enumerate(years[:-1]):
-            col = get_column_letter(i + 2)
-            curr_rev = financials.get("income_statement", {}).get(year, {}).get("revenue")
-            prev_rev = financials.get("income_statement", {}).get(years[i + 1], {}).get("revenue")
+        for curr, prev, col in zip(income_rows, income_rows[1:], cols):
+            curr_rev = curr.get("revenue")
+            prev_rev = prev.get("revenue")
             if curr_rev and prev_rev and prev_rev != 0:
                 ws[f"{col}{row}"] = (curr_rev - prev_rev) / prev_rev
                 ws[f"{col}{row}"].number_format = NUMBER_FORMAT_PERCENT
@@ -291,10 +393,9 @@ class DCFTemplateGenerator:
 
         # Margins
         ws[f"A{row}"] = "EBITDA Margin"
-        for i, year in enumerate(years):
-            col = get_column_letter(i + 2)
-            ebitda = financials.get("income_statement", {}).get(year, {}).get("ebitda")
-            revenue = financials.get("income_statement", {}).get(year, {}).get("revenue")
+        for yr_data, col in zip(income_rows, cols):
+            ebitda = yr_data.get("ebitda")
+            revenue = yr_data.get("revenue")
             if ebitda and revenue and revenue != 0:
                 ws[f"{col}{row}"] = ebitda / revenue
                 ws[f"{col}{row}"].number_format = NUMBER_FORMAT_PERCENT
@@ -302,12 +403,9 @@ class DCFTemplateGenerator:
         # Balance sheet section
         row += 2
         ws[f"A{row}"] = "Balance Sheet"
-        ws[f"A{row}"].font = HEADER_FONT
-        ws[f"A{row}"].fill = HEADER_FILL
-        for i, year in enumerate(years):
-            col = get_column_letter(i + 2)
-            ws[f"{col}{row}"].font = HEADER_FONT
-            ws[f"{col}{row}"].fill = HEADER_FILL
+        ws[f"A{row}"].style = "section_header"
+        for col in cols:
+            ws[f"{col}{row}"].style = "section_header"
         row += 1
 
         balance_items = [
@@ -318,46 +416,37 @@ class DCFTemplateGenerator:
             ("Total Debt", "total_debt"),
         ]
 
-        for label, key in balance_items:
-            ws[f"A{row}"] = label
-            for i, year in enumerate(years):
-                col = get_column_letter(i + 2)
-                value = financials.get("balance_sheet", {}).get(year, {}).get(key)
-                ws[f"{col}{row}"] = value / 1e6 if value else None
-                ws[f"{col}{row}"].number_format = NUMBER_FORMAT_MILLIONS
-            row += 1
+        self._append_rows(
+            ws,
+            [[label] + [_millions(yr_data.get(key)) for yr_data in balance_rows]
+             for label, key in balance_items],
+            [NUMBER_FORMAT_MILLIONS] * len(balance_items),
+        )
 
         # Column widths
         ws.column_dimensions["A"].width = 20
-        for i in range(len(years)):
-            ws.column_dimensions[get_column_letter(i + 2)].width = 15
+        for col in cols:
+            ws.column_dimensions[col].width = 15
 
     def _create_projections(self) -> None:
         """Create projections sheet."""
         ws = self.wb.create_sheet("Projections")
 
         ws["A1"] = "FINANCIAL PROJECTIONS"
-        ws["A1"].font = Font(bold=True, size=14)
+        ws["A1"].font = SHEET_TITLE_FONT
 
-        # Get base year revenue
-        financials = self.data["financials"]
-        years = sorted(financials.get("years", []), reverse=True)
-        base_revenue = 0
-        if years:
-            base_revenue = financials.get("income_statement", {}).get(years[0], {}).get("revenue", 0) or 0
-            base_revenue = base_revenue / 1e6
-
-        proj_years = list(range(self.current_year, self.current_year + 6))
+        # The explicit forecast plus one terminal year
+        proj_years = list(range(
+            self.current_year, self.current_year + config.DEFAULT_PROJECTION_YEARS + 1
+        ))
 
         # Headers
         ws["A3"] = "Projection"
-        ws["A3"].font = HEADER_FONT
-        ws["A3"].fill = HEADER_FILL
+        ws["A3"].style = "section_header"
         for i, year in enumerate(proj_years):
-            col = get_column_letter(i + 2)
+            col = COL_LETTERS[i + 1]
             ws[f"{col}3"] = year
-            ws[f"{col}3"].font = HEADER_FONT
-            ws[f"{col}3"].fill = HEADER_FILL
+            ws[f"{col}3"].style = "section_header"
 
         # Projections with formulas
         items = [
@@ -375,75 +464,82 @@ class DCFTemplateGenerator:
             ("Unlevered FCF", NUMBER_FORMAT_MILLIONS),
         ]
 
-        row = 4
-        for label, fmt in items:
-            ws[f"A{row}"] = label
-            for i, year in enumerate(proj_years):
-                col = get_column_letter(i + 2)
-                ws[f"{col}{row}"].number_format = fmt
-
-                if label == "Revenue":
-                    if i == 0:
-                        ws[f"{col}{row}"] = base_revenue
-                    else:
-                        prev_col = get_column_letter(i + 1)
-                        ws[f"{col}{row}"] = f"={prev_col}{row}*(1+Assumptions!$B$30)"
-                elif label == "Revenue Growth":
-                    ws[f"{col}{row}"] = "=Assumptions!$B$30"
-                elif label == "EBITDA":
-                    ws[f"{col}{row}"] = f"={col}4*Assumptions!$B$31"
-                elif label == "EBITDA Margin":
-                    ws[f"{col}{row}"] = "=Assumptions!$B$31"
-                elif label == "D&A":
-                    ws[f"{col}{row}"] = f"={col}4*Assumptions!$B$32"
-                elif label == "EBIT":
-                    ws[f"{col}{row}"] = f"={col}6-{col}8"
-                elif label == "Less: Taxes":
-                    ws[f"{col}{row}"] = f"={col}9*Assumptions!$B$22"
-                elif label == "NOPAT":
-                    ws[f"{col}{row}"] = f"={col}9-{col}10"
-                elif label == "Plus: D&A":
-                    ws[f"{col}{row}"] = f"={col}8"
-                elif label == "Less: CapEx":
-                    ws[f"{col}{row}"] = f"={col}4*Assumptions!$B$33"
-                elif label == "Less: Change in NWC":
-                    if i == 0:
-                        ws[f"{col}{row}"] = 0
-                    else:
-                        prev_col = get_column_letter(i + 1)
-                        ws[f"{col}{row}"] = f"=({col}4-{prev_col}4)*Assumptions!$B$34"
-                elif label == "Unlevered FCF":
-                    ws[f"{col}{row}"] = f"={col}11+{col}12-{col}13-{col}14"
-
-            row += 1
+        # Sheet row of each line item; rows are appended below the header row
+        row_of = {label: row for row, (label, _) in enumerate(items, start=4)}
+        self._proj_rows = row_of
+
+        # Formula for each line item, given its column and the one before it
+        formulas = {
+            "Revenue": lambda col, prev: f"={prev}{row_of['Revenue']}*(1+Assumptions!$B$30)",
+            "Revenue Growth": lambda col, prev: "=Assumptions!$B$30",
+            "EBITDA": lambda col, prev: f"={col}{row_of['Revenue']}*Assumptions!$B$31",
+            "EBITDA Margin": lambda col, prev: "=Assumptions!$B$31",
+            "D&A": lambda col, prev: f"={col}{row_of['Revenue']}*Assumptions!$B$32",
+            "EBIT": lambda col, prev: f"={col}{row_of['EBITDA']}-{col}{row_of['D&A']}",
+            "Less: Taxes": lambda col, prev: f"={col}{row_of['EBIT']}*Assumptions!$B$22",
+            "NOPAT": lambda col, prev: f"={col}{row_of['EBIT']}-{col}{row_of['Less: Taxes']}",
+            "Plus: D&A": lambda col, prev: f"={col}{row_of['D&A']}",
+            "Less: CapEx": lambda col, prev: f"={col}{row_of['Revenue']}*Assumptions!$B$33",
+            "Less: Change in NWC": lambda col, prev: (
+                f"=({col}{row_of['Revenue']}-{prev}{row_of['Revenue']})*Assumptions!$B$34"
+            ),
+            "Unlevered FCF": lambda col, prev: (
+                f"={col}{row_of['NOPAT']}+{col}{row_of['Plus: D&A']}"
+                f"-{col}{row_of['Less: CapEx']}-{col}{row_of['Less: Change in NWC']}"
+            ),
+        }
+        # The first projection year has no prior year to grow from
+        first_year = {"Revenue": self._base_revenue_m, "Less: Change in NWC": 0}
+
+        columns = list(zip(COL_LETTERS[1:len(proj_years) + 1], COL_LETTERS))
+        rows = []
+        for label, _ in items:
+            if self.mode == "values":
+                rows.append([label] + self._values["projections"][label])
+                continue
+            build = formulas[label]
+            values = [build(col, prev) for col, prev in columns]
+            if label in first_year:
+                values[0] = first_year[label]
+            rows.append([label] + values)
+
+        # One row per line item, from row 4
+        self._append_rows(ws, rows, [fmt for _, fmt in items])
 
         # Highlight FCF row
-        for i in range(len(proj_years)):
-            col = get_column_letter(i + 2)
-            ws[f"{col}15"].fill = SUBHEADER_FILL
+        fcf_row = self._proj_rows["Unlevered FCF"]
+        for col, _ in columns:
+            ws[f"{col}{fcf_row}"].fill = SUBHEADER_FILL
 
         # Column widths
         ws.column_dimensions["A"].width = 22
         for i in range(len(proj_years)):
-            ws.column_dimensions[get_column_letter(i + 2)].width = 14
+            ws.column_dimensions[COL_LETTERS[i + 1]].width = 14
 
     def _create_valuation(self) -> None:
         """Create DCF valuation sheet."""
         ws = self.wb.create_sheet("Valuation")
+        info = self.data["info"]
 
         ws["A1"] = "DCF VALUATION"
-        ws["A1"].font = Font(bold=True, size=14)
+        ws["A1"].font = SHEET_TITLE_FONT
 
         # DCF inputs
         ws["A3"] = "VALUATION INPUTS"
-        ws["A3"].font = HEADER_FONT
-        ws["A3"].fill = HEADER_FILL
-        ws.merge_cells("A3:B3")
+        ws["A3"].style = "section_header"
+        merges = ["A3:B3"]
+
+        # Projections columns: B onwards is the forecast, then the terminal year
+        years = config.DEFAULT_PROJECTION_YEARS
+        fcf_row = self._proj_rows["Unlevered FCF"]
+        fcf_range = f"Projections!B{fcf_row}:{COL_LETTERS[years]}{fcf_row}"
+        terminal_fcf = f"=Projections!{COL_LETTERS[years + 1]}{fcf_row}"
+        exponents = ",".join(str(n) for n in range(1, years + 1))
 
         inputs = [
-            ("WACC", "=Assumptions!B26", NUMBER_FORMAT_PERCENT),
-            ("Terminal Growth Rate", "=Assumptions!B35", NUMBER_FORMAT_PERCENT),
-            ("Terminal Year FCF", "=Projections!G15", NUMBER_FORMAT_MILLIONS),
+            ("WACC", self._formula("=Assumptions!B26", "wacc"), NUMBER_FORMAT_PERCENT),
+            ("Terminal Growth Rate", self._formula("=Assumptions!B35", "terminal_growth"), NUMBER_FORMAT_PERCENT),
+            ("Terminal Year FCF", self._formula(terminal_fcf, "terminal_fcf"), NUMBER_FORMAT_MILLIONS),
         ]
 
         row = 4
@@ -456,31 +552,28 @@ class DCFTemplateGenerator:
         # Terminal value calculation
         row += 1
         ws[f"A{row}"] = "TERMINAL VALUE"
-        ws[f"A{row}"].font = HEADER_FONT
-        ws[f"A{row}"].fill = HEADER_FILL
-        ws.merge_cells(f"A{row}:B{row}")
+        ws[f"A{row}"].style = "section_header"
+        merges.append(f"A{row}:B{row}")
         row += 1
 
         ws[f"A{row}"] = "Terminal Value"
-        ws[f"B{row}"] = "=B6*(1+B5)/(B4-B5)"
+        ws[f"B{row}"] = self._formula("=B6*(1+B5)/(B4-B5)", "terminal_value")
         ws[f"B{row}"].number_format = NUMBER_FORMAT_MILLIONS
         row += 1
 
         # Present value calculations
         row += 1
         ws[f"A{row}"] = "PRESENT VALUE CALCULATION"
-        ws[f"A{row}"].font = HEADER_FONT
-        ws[f"A{row}"].fill = HEADER_FILL
-        ws.merge_cells(f"A{row}:B{row}")
+        ws[f"A{row}"].style = "section_header"
+        merges.append(f"A{row}:B{row}")
         row += 1
 
+        # One discounted sum over the explicit forecast instead of a row per year
         pv_items = [
-            ("PV of FCF Year 1", "=Projections!B15/(1+$B$4)^1"),
-            ("PV of FCF Year 2", "=Projections!C15/(1+$B$4)^2"),
-            ("PV of FCF Year 3", "=Projections!D15/(1+$B$4)^3"),
-            ("PV of FCF Year 4", "=Projections!E15/(1+$B$4)^4"),
-            ("PV of FCF Year 5", "=Projections!F15/(1+$B$4)^5"),
-            ("PV of Terminal Value", "=B9/(1+$B$4)^5"),
+            ("PV of Projected FCF", self._formula(
+                f"=SUMPRODUCT({fcf_range}/(1+$B$4)^{{{exponents}}})", "pv_fcf"
+            )),
+            ("PV of Terminal Value", self._formula(f"=B9/(1+$B$4)^{years}", "pv_terminal_value")),
         ]
 
         for label, formula in pv_items:
@@ -492,167 +585,268 @@ class DCFTemplateGenerator:
         # Enterprise and equity value
         row += 1
         ws[f"A{row}"] = "VALUATION SUMMARY"
-        ws[f"A{row}"].font = HEADER_FONT
-        ws[f"A{row}"].fill = HEADER_FILL
-        ws.merge_cells(f"A{row}:B{row}")
+        ws[f"A{row}"].style = "section_header"
+        merges.append(f"A{row}:B{row}")
         row += 1
 
         ev_row = row
         ws[f"A{row}"] = "Enterprise Value"
-        ws[f"B{row}"] = "=SUM(B12:B17)"
+        ws[f"B{row}"] = self._formula("=B12+B13", "enterprise_value")
         ws[f"B{row}"].number_format = NUMBER_FORMAT_MILLIONS
         ws[f"B{row}"].fill = SUBHEADER_FILL
         row += 1
 
+        latest_balance = self._balance.get(self._latest_year, {})
         ws[f"A{row}"] = "Less: Debt"
-        debt = self._get_latest_debt()
+        debt = latest_balance.get("total_debt")
         ws[f"B{row}"] = debt / 1e6 if debt else 0
         ws[f"B{row}"].number_format = NUMBER_FORMAT_MILLIONS
         row += 1
 
         ws[f"A{row}"] = "Plus: Cash"
-        cash = self._get_latest_cash()
+        cash = latest_balance.get("cash")
         ws[f"B{row}"] = cash / 1e6 if cash else 0
         ws[f"B{row}"].number_format = NUMBER_FORMAT_MILLIONS
         row += 1
 
         eq_row = row
         ws[f"A{row}"] = "Equity Value"
-        ws[f"B{row}"] = f"=B{ev_row}-B{ev_row+1}+B{ev_row+2}"
+        ws[f"B{row}"] = self._formula(f"=B{ev_row}-B{ev_row+1}+B{ev_row+2}", "equity_value")
         ws[f"B{row}"].number_format = NUMBER_FORMAT_MILLIONS
         ws[f"B{row}"].fill = SUBHEADER_FILL
         row += 1
 
         ws[f"A{row}"] = "Shares Outstanding (M)"
-        shares = self.data["info"].get("shares_outstanding")
+        shares = info.get("shares_outstanding")
         ws[f"B{row}"] = shares / 1e6 if shares else 0
         ws[f"B{row}"].number_format = "0.0"
         row += 1
 
-        ws[f"A{row}"] = "DCF Value per Share"
-        ws[f"B{row}"] = f"=IF(B{row-1}>0,B{eq_row}/B{row-1},0)"
-        ws[f"B{row}"].number_format = NUMBER_FORMAT_CURRENCY
-        ws[f"B{row}"].fill = INPUT_FILL
-        ws[f"B{row}"].font = Font(bold=True)
+        ws[f"A{row}"] = "DCF Value per Share"  # B21, see VALUE_PER_SHARE_REF
+        ws[f"B{row}"] = self._formula(f"=IF(B{row-1}>0,B{eq_row}/B{row-1},0)", "value_per_share")
+        ws[f"B{row}"].style = "key_output"
         row += 1
 
         ws[f"A{row}"] = "Current Price"
-        ws[f"B{row}"] = self.data["info"].get("price")
+        ws[f"B{row}"] = info.get("price")
         ws[f"B{row}"].number_format = NUMBER_FORMAT_CURRENCY
         row += 1
 
         ws[f"A{row}"] = "Implied Upside/(Downside)"
-        ws[f"B{row}"] = f"=IF(B{row-1}>0,(B{row-2}-B{row-1})/B{row-1},0)"
+        ws[f"B{row}"] = self._formula(f"=IF(B{row-1}>0,(B{row-2}-B{row-1})/B{row-1},0)", "upside")
         ws[f"B{row}"].number_format = NUMBER_FORMAT_PERCENT
-        ws[f"B{row}"].font = Font(bold=True)
+        ws[f"B{row}"].font = BOLD_FONT
+
+        self._merge(ws, merges)
 
         # Column widths
         ws.column_dimensions["A"].width = 25
         ws.column_dimensions["B"].width = 18
 
-    def _get_latest_debt(self) -> float:
-        """Get most recent total debt."""
-        financials = self.data["financials"]
-        years = sorted(financials.get("years", []), reverse=True)
-        if years:
-            return financials.get("balance_sheet", {}).get(years[0], {}).get("total_debt") or 0
-        return 0
-
-    def _get_latest_cash(self) -> float:
-        """Get most recent cash balance."""
-        financials = self.data["financials"]
-        years = sorted(financials.get("years", []), reverse=True)
-        if years:
-            return financials.get("balance_sheet", {}).get(years[0], {}).get("cash") or 0
-        return 0
+    def _formula(self, formula: str, key: str):
+        """Return a cell's formula, or its evaluated result in values mode."""
+        if self.mode == "values":
+            return self._values[key]
+        return formula
+
+    def _evaluate(self) -> dict:
+        """Evaluate the model's formula chain with the default assumptions.
+
+        Mirrors the formulas written to Assumptions, Projections and
+        Valuation, including Excel treating blank inputs as zero. Amounts
+        are in millions, as on the sheets.
+        """
+        info = self.data["info"]
+        years = config.DEFAULT_PROJECTION_YEARS
+        tax = config.DEFAULT_TAX_RATE
+        terminal_growth = config.DEFAULT_TERMINAL_GROWTH
+
+        # Assumptions
+        beta = info.get("beta") or 0
+        cost_of_equity = (self.data["risk_free"] or 0) + beta * config.DEFAULT_EQUITY_RISK_PREMIUM
+        cost_of_debt = COST_OF_DEBT * (1 - tax)
+        equity_weight = 1 - DEBT_TO_CAPITAL
+        wacc = cost_of_equity * equity_weight + cost_of_debt * DEBT_TO_CAPITAL
+
+        # Projections, one entry per year including the terminal year
+        revenue = [self._base_revenue_m]
+        for _ in range(years):
+            revenue.append(revenue[-1] * (1 + REVENUE_GROWTH))
+        ebitda = [r * EBITDA_MARGIN for r in revenue]
+        da = [r * DA_PCT_REVENUE for r in revenue]
+        ebit = [e - d for e, d in zip(ebitda, da)]
+        taxes = [e * tax for e in ebit]
+        nopat = [e - t for e, t in zip(ebit, taxes)]
+        capex = [r * CAPEX_PCT_REVENUE for r in revenue]
+        nwc = [0] + [(cur - prev) * NWC_PCT_REVENUE for prev, cur in zip(revenue, revenue[1:])]
+        fcf = [n + d - c - w for n, d, c, w in zip(nopat, da, capex, nwc)]
+
+        # Valuation
+        pv_fcf = sum(fcf[i] / (1 + wacc) ** (i + 1) for i in range(years))
+        latest_balance = self._balance.get(self._latest_year, {})
+        debt = (latest_balance.get("total_debt") or 0) / 1e6
+        cash = (latest_balance.get("cash") or 0) / 1e6
+        if wacc == terminal_growth:
+            # The Gordon growth divisor is zero; Excel's #DIV/0! carries
+            # through every cell built on the terminal value
+            terminal_value = pv_terminal_value = DIV_ZERO_ERROR
+            enterprise_value = equity_value = DIV_ZERO_ERROR
+        else:
+            terminal_value = fcf[years] * (1 + terminal_growth) / (wacc - terminal_growth)
+            pv_terminal_value = terminal_value / (1 + wacc) ** years
+            enterprise_value = pv_fcf + pv_terminal_value
+            equity_value = enterprise_value - debt + cash
+
+        shares = (info.get("shares_outstanding") or 0) / 1e6
+        if shares <= 0:
+            value_per_share = 0
+        elif equity_value == DIV_ZERO_ERROR:
+            value_per_share = DIV_ZERO_ERROR
+        else:
+            value_per_share = equity_value / shares
+        price = info.get("price")
+        if not (price and price > 0):
+            upside = 0
+        elif value_per_share == DIV_ZERO_ERROR:
+            upside = DIV_ZERO_ERROR
+        else:
+            upside = (value_per_share - price) / price
+
+        return {
+            "cost_of_equity": cost_of_equity,
+            "cost_of_debt": cost_of_debt,
+            "equity_weight": equity_weight,
+            "wacc": wacc,
+            "terminal_growth": terminal_growth,
+            "projections": {
+                "Revenue": revenue,
+                "Revenue Growth": [REVENUE_GROWTH] * len(revenue),
+                "EBITDA": ebitda,
+                "EBITDA Margin": [EBITDA_MARGIN] * len(revenue),
+                "D&A": da,
+                "EBIT": ebit,
+                "Less: Taxes": taxes,
+                "NOPAT": nopat,
+                "Plus: D&A": da,
+                "Less: CapEx": capex,
+                "Less: Change in NWC": nwc,
+                "Unlevered FCF": fcf,
+            },
+            "terminal_fcf": fcf[years],
+            "terminal_value": terminal_value,
+            "pv_fcf": pv_fcf,
+            "pv_terminal_value": pv_terminal_value,
+            "enterprise_value": enterprise_value,
+            "equity_value": equity_value,
+            "value_per_share": value_per_share,
+            "price": price or 0,
+            "upside": upside,
+        }
+
+    @staticmethod
+    def _merge(ws, ranges: list) -> None:
+        """Merge each of a sheet's header ranges."""
+        for cell_range in ranges:
+            ws.merge_cells(cell_range)
+
+    @staticmethod
+    def _append_rows(ws, rows: list, formats: list) -> None:
+        """Append labelled rows, then give each row's values its number format."""
+        start = ws.max_row + 1
+        for row_data in rows:
+            ws.append(row_data)
+
+        last_col = max(len(row_data) for row_data in rows)
+        cells = ws.iter_rows(
+            min_row=start, max_row=start + len(rows) - 1, min_col=2, max_col=last_col
+        )
+        for row_cells, fmt in zip(cells, formats):
+            for cell in row_cells:
+                cell.number_format = fmt
 
     def _create_comps(self) -> None:
         """Create comparable companies sheet (placeholder for peer input)."""
         ws = self.wb.create_sheet("Comps")
+        info = self.data["info"]
 
         ws["A1"] = "COMPARABLE COMPANY ANALYSIS"
-        ws["A1"].font = Font(bold=True, size=14)
+        ws["A1"].font = SHEET_TITLE_FONT
 
         ws["A3"] = "Enter peer tickers below (up to 10):"
 
         # Header row
         headers = ["Company", "Ticker", "EV (M)", "Revenue (M)", "EBITDA (M)", "EV/Rev", "EV/EBITDA", "P/E"]
         for i, header in enumerate(headers):
-            col = get_column_letter(i + 1)
+            col = COL_LETTERS[i]
             ws[f"{col}5"] = header
-            ws[f"{col}5"].font = HEADER_FONT
-            ws[f"{col}5"].fill = HEADER_FILL
+            ws[f"{col}5"].style = "section_header"
 
         # Input rows for peers
         for row in range(6, 16):
-            ws[f"B{row}"].fill = INPUT_FILL
+            ws.cell(row=row, column=2).style = "peer_input"
 
         # Target company row
-        ws["A17"] = self.data["info"].get("name", self.ticker)
+        ws["A17"] = info.get("name", self.ticker)
         ws["B17"] = self.ticker
-        ws["A17"].font = Font(bold=True)
-        ws["B17"].font = Font(bold=True)
+        ws["A17"].font = BOLD_FONT
+        ws["B17"].font = BOLD_FONT
 
         # Median row
         ws["A18"] = "Median"
-        ws["A18"].font = Font(bold=True)
-        ws["A18"].fill = SUBHEADER_FILL
+        ws["A18"].style = "total_label"
 
         # Column widths
         ws.column_dimensions["A"].width = 25
         ws.column_dimensions["B"].width = 10
         for i in range(3, 9):
-            ws.column_dimensions[get_column_letter(i)].width = 14
+            ws.column_dimensions[COL_LETTERS[i - 1]].width = 14
 
     def _create_sensitivity(self) -> None:
         """Create sensitivity analysis sheet."""
         ws = self.wb.create_sheet("Sensitivity")
 
         ws["A1"] = "SENSITIVITY ANALYSIS"
-        ws["A1"].font = Font(bold=True, size=14)
+        ws["A1"].font = SHEET_TITLE_FONT
 
         # WACC vs Terminal Growth matrix
         ws["A3"] = "DCF Value per Share: WACC vs Terminal Growth"
-        ws["A3"].font = Font(bold=True)
+        ws["A3"].font = BOLD_FONT
 
         # Terminal growth rates (columns)
         growth_rates = [0.015, 0.02, 0.025, 0.03, 0.035]
         for i, rate in enumerate(growth_rates):
-            col = get_column_letter(i + 2)
+            col = COL_LETTERS[i + 1]
             ws[f"{col}4"] = rate
+            ws[f"{col}4"].style = "section_header"
             ws[f"{col}4"].number_format = NUMBER_FORMAT_PERCENT
-            ws[f"{col}4"].fill = HEADER_FILL
-            ws[f"{col}4"].font = HEADER_FONT
 
         # WACC rates (rows)
         wacc_rates = [0.08, 0.09, 0.10, 0.11, 0.12]
         for i, wacc in enumerate(wacc_rates):
             row = 5 + i
             ws[f"A{row}"] = wacc
+            ws[f"A{row}"].style = "section_header"
             ws[f"A{row}"].number_format = NUMBER_FORMAT_PERCENT
-            ws[f"A{row}"].fill = HEADER_FILL
-            ws[f"A{row}"].font = HEADER_FONT
 
             # Placeholder values - in real model these would be formulas
             for j in range(len(growth_rates)):
-                col = get_column_letter(j + 2)
-                ws[f"{col}{row}"].number_format = NUMBER_FORMAT_CURRENCY
-                ws[f"{col}{row}"].fill = SUBHEADER_FILL
+                ws.cell(row=row, column=j + 2).style = "sensitivity_cell"
 
         ws["A4"] = "WACC \\ TGR"
-        ws["A4"].font = Font(bold=True)
+        ws["A4"].font = BOLD_FONT
 
         # Column widths
         ws.column_dimensions["A"].width = 15
         for i in range(len(growth_rates)):
-            ws.column_dimensions[get_column_letter(i + 2)].width = 12
+            ws.column_dimensions[COL_LETTERS[i + 1]].width = 12
 
     def _create_football_field(self) -> None:
         """Create football field data and chart sheet."""
         ws = self.wb.create_sheet("Football Field")
+        info = self.data["info"]
 
         ws["A1"] = "FOOTBALL FIELD VALUATION"
-        ws["A1"].font = Font(bold=True, size=14)
+        ws["A1"].font = SHEET_TITLE_FONT
 
         # Valuation ranges data
         ws["A3"] = "Valuation Method"
@@ -661,33 +855,45 @@ class DCFTemplateGenerator:
         ws["D3"] = "High"
 
         for col in ["A", "B", "C", "D"]:
-            ws[f"{col}3"].font = HEADER_FONT
-            ws[f"{col}3"].fill = HEADER_FILL
-
-        methods = [
-            ("DCF - Bear Case", "=Valuation!B24*0.85", "=Valuation!B24*0.95", "=Valuation!B24"),
-            ("DCF - Base Case", "=Valuation!B24", "=Valuation!B24*1.05", "=Valuation!B24*1.15"),
-            ("DCF - Bull Case", "=Valuation!B24*1.1", "=Valuation!B24*1.2", "=Valuation!B24*1.35"),
-            ("52-Week Range", self.data["info"].get("fifty_two_week_low"), None, self.data["info"].get("fifty_two_week_high")),
-        ]
+            ws[f"{col}3"].style = "section_header"
 
-        for i, (method, low, mid, high) in enumerate(methods, start=4):
-            ws[f"A{i}"] = method
-            ws[f"B{i}"] = low
-            if mid:
-                ws[f"C{i}"] = mid
+        # Low/mid/high as multiples of the DCF value per share
+        scenarios = [
+            ("DCF - Bear Case", (0.85, 0.95, 1)),
+            ("DCF - Base Case", (1, 1.05, 1.15)),
+            ("DCF - Bull Case", (1.1, 1.2, 1.35)),
+        ]
+        methods = []
+        for method, multiples in scenarios:
+            if self.mode == "values":
+                per_share = self._values["value_per_share"]
+                if per_share == DIV_ZERO_ERROR:
+                    methods.append((method, *(DIV_ZERO_ERROR for _ in multiples)))
+                else:
+                    methods.append((method, *(per_share * m for m in multiples)))
             else:
-                ws[f"C{i}"] = f"=(B{i}+D{i})/2"
-            ws[f"D{i}"] = high
-
-            for col in ["B", "C", "D"]:
-                ws[f"{col}{i}"].number_format = NUMBER_FORMAT_CURRENCY
+                dcf = VALUE_PER_SHARE_REF
+                methods.append((method, *(f"={dcf}" if m == 1 else f"={dcf}*{m}" for m in multiples)))
+        low = info.get("fifty_two_week_low")
+        high = info.get("fifty_two_week_high")
+        methods.append(("52-Week Range", low, None, high))
+
+        # One row per method below the header (rows 4-7)
+        rows = []
+        for i, (method, low, mid, high) in enumerate(methods, start=4):
+            if not mid:
+                if self.mode == "values":
+                    mid = ((low or 0) + (high or 0)) / 2
+                else:
+                    mid = f"=(B{i}+D{i})/2"
+            rows.append([method, low, mid, high])
+        self._append_rows(ws, rows, [NUMBER_FORMAT_CURRENCY] * len(rows))
 
         # Current price reference line
         ws["A9"] = "Current Price"
-        ws["B9"] = self.data["info"].get("price")
+        ws["B9"] = info.get("price")
         ws["B9"].number_format = NUMBER_FORMAT_CURRENCY
-        ws["B9"].font = Font(bold=True)
+        ws["B9"].font = BOLD_FONT
 
         # Create bar chart
         chart = BarChart()
@@ -714,7 +920,12 @@ class DCFTemplateGenerator:
             ws.column_dimensions[col].width = 12
 
 
-def generate_dcf_model(ticker: str, output_path: Optional[Path] = None) -> Path:
-    """Generate a complete DCF model for a given ticker."""
-    generator = DCFTemplateGenerator(ticker)
+def generate_dcf_model(
+    ticker: str, output_path: Optional[Path] = None, mode: str = "formulas"
+) -> Path:
+    """Generate a complete DCF model for a given ticker.
+
+    Pass mode="values" to write evaluated numbers instead of formulas.
+    """
+    generator = DCFTemplateGenerator(ticker, mode)
     return generator.generate(output_path)
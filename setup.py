@@ -14,6 +14,7 @@ setup(
     ],
     extras_require={
         "dev": ["pytest>=7.0.0"],
+        "fast": ["wolfxl>=2.0"],
     },
     python_requires=">=3.8",
     author="Connor Evans",
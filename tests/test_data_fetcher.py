@@ -1,54 +1,109 @@
 """Tests for data_fetcher module."""
 
 import pytest
-from unittest.mock import patch, MagicMock
-import tempfile
-from pathlib import Path
+from unittest.mock import patch, MagicMock, PropertyMock
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 
+import pandas as pd
+
+from dcf_builder import config
 from dcf_builder import data_fetcher as df
 from dcf_builder.data_fetcher import Cache
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Give each test an empty cache in its own directory.
+
+    Fetchers pick up the module-level cache when constructed, so tests
+    never read or clear the user's real cache.
+    """
+    cache = Cache(tmp_path / "fetcher")
+    monkeypatch.setattr(df, "_cache", cache)
+    monkeypatch.setattr(df._fetcher, "cache", cache)
+    df._fetcher._tickers.clear()
+    yield cache
+    df._fetcher._tickers.clear()
+    cache.close()
+
+
 class TestCache:
     """Tests for the Cache class."""
 
-    def test_cache_set_and_get(self):
+    def test_cache_set_and_get(self, tmp_path):
         """Test basic cache set and get operations."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(Path(tmpdir))
-            cache.set("test_key", {"value": 123})
+        cache = Cache(tmp_path)
+        cache.set("test_key", {"value": 123})
 
-            # Should retrieve within TTL
-            result = cache.get("test_key", ttl=3600)
-            assert result == {"value": 123}
+        # Should retrieve within TTL
+        result = cache.get("test_key", ttl=3600)
+        assert result == {"value": 123}
+        cache.close()
 
-    def test_cache_expiry(self):
+    def test_cache_expiry(self, tmp_path):
         """Test that expired cache entries return None."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(Path(tmpdir))
-            cache.set("test_key", "test_value")
+        cache = Cache(tmp_path)
+        cache.set("test_key", "test_value")
+
+        # Should return None for 0 TTL (immediately expired)
+        result = cache.get("test_key", ttl=0)
+        assert result is None
 
-            # Should return None for 0 TTL (immediately expired)
-            result = cache.get("test_key", ttl=0)
-            assert result is None
+        # Stale value is still available for error fallbacks
+        assert cache.get_any("test_key") == "test_value"
+        cache.close()
 
-    def test_cache_clear(self):
+    def test_cache_clear(self, tmp_path):
         """Test cache clearing."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(Path(tmpdir))
-            cache.set("key1", "value1")
-            cache.set("key2", "value2")
+        cache = Cache(tmp_path)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+
+        cache.clear()
+
+        assert cache.get("key1", ttl=3600) is None
+        assert cache.get("key2", ttl=3600) is None
+        cache.close()
+
+    def test_cache_persists_across_instances(self, tmp_path):
+        """Test that values are read back from disk with their types intact."""
+        cache = Cache(tmp_path)
+        cache.set("financials_AAPL", {2024: {"revenue": 1.5e11}})
+        cache.close()
+
+        reopened = Cache(tmp_path)
+        result = reopened.get("financials_AAPL", ttl=3600)
+        assert result == {2024: {"revenue": 1.5e11}}
+        reopened.close()
+
+    def test_cache_reads_are_memoized(self, tmp_path):
+        """Test that repeat reads reuse the decoded value."""
+        writer = Cache(tmp_path)
+        writer.set("stock_info_AAPL", {"price": 150.0})
+        writer.close()
 
-            cache.clear()
+        cache = Cache(tmp_path)
+        first = cache.get("stock_info_AAPL", ttl=3600)
+        assert cache.get("stock_info_AAPL", ttl=3600) is first
+        cache.close()
 
-            assert cache.get("key1", ttl=3600) is None
-            assert cache.get("key2", ttl=3600) is None
+    def test_cache_memory_tier_is_bounded(self, tmp_path):
+        """Test that evicted entries are still served from disk."""
+        cache = Cache(tmp_path)
+        cache.memory_size = 2
+        for i in range(5):
+            cache.set(f"key{i}", i)
+
+        assert len(cache._memory) == 2
+        assert cache.get("key0", ttl=3600) == 0
+        cache.close()
 
 
 class TestDataFetcher:
     """Tests for DataFetcher class."""
 
-    @patch("dcf_builder.data_fetcher.yf.Ticker")
+    @patch("yfinance.Ticker")
     def test_get_stock_info(self, mock_ticker):
         """Test fetching stock info."""
         # Setup mock
@@ -65,9 +120,6 @@ class TestDataFetcher:
         }
         mock_ticker.return_value = mock_ticker_instance
 
-        # Clear cache first
-        df.clear_cache()
-
         fetcher = df.DataFetcher()
         result = fetcher.get_stock_info("AAPL")
 
@@ -76,33 +128,168 @@ class TestDataFetcher:
         assert result["beta"] == 1.2
         assert result["name"] == "Apple Inc."
 
-    @patch("dcf_builder.data_fetcher.yf.Ticker")
+    @patch("yfinance.Ticker")
     def test_get_price(self, mock_ticker):
         """Test get_price convenience function."""
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"currentPrice": 150.0}
         mock_ticker.return_value = mock_ticker_instance
 
-        df.clear_cache()
         price = df.get_price("AAPL")
         assert price == 150.0
 
-    @patch("dcf_builder.data_fetcher.yf.Ticker")
+    @patch("yfinance.Ticker")
     def test_get_market_cap(self, mock_ticker):
         """Test get_market_cap returns value in millions."""
         mock_ticker_instance = MagicMock()
         mock_ticker_instance.info = {"marketCap": 2500000000000}
         mock_ticker.return_value = mock_ticker_instance
 
-        df.clear_cache()
         market_cap = df.get_market_cap("AAPL")
         assert market_cap == 2500000.0  # In millions
 
-    @patch("dcf_builder.data_fetcher.Fred")
+    @patch("yfinance.Ticker")
+    def test_get_historical_financials(self, mock_ticker):
+        """Test statement rows are mapped per fiscal year."""
+        years = pd.to_datetime(["2024-09-30", "2023-09-30"])
+        mock_ticker_instance = MagicMock()
+        mock_ticker_instance.financials = pd.DataFrame(
+            [[400e9, 380e9], [130e9, float("nan")]],
+            index=["Total Revenue", "EBITDA"],
+            columns=years,
+        )
+        mock_ticker_instance.balance_sheet = pd.DataFrame(
+            [[100e9, 90e9]], index=["Total Debt"], columns=years
+        )
+        mock_ticker.return_value = mock_ticker_instance
+
+        result = df.DataFetcher().get_historical_financials("AAPL")
+
+        assert result["years"] == [2024, 2023]
+        assert result["income_statement"][2024]["revenue"] == 400e9
+        assert result["income_statement"][2023]["ebitda"] is None
+        assert result["income_statement"][2024]["net_income"] is None
+        assert result["balance_sheet"][2023]["total_debt"] == 90e9
+
+    @patch("yfinance.Ticker")
+    def test_ticker_object_reused(self, mock_ticker):
+        """Test that info and financials share one yfinance Ticker."""
+        mock_ticker_instance = MagicMock()
+        mock_ticker_instance.info = {"currentPrice": 150.0}
+        mock_ticker_instance.financials.empty = True
+        mock_ticker_instance.balance_sheet.empty = True
+        mock_ticker.return_value = mock_ticker_instance
+
+        fetcher = df.DataFetcher()
+        fetcher.get_stock_info("AAPL")
+        fetcher.get_historical_financials("AAPL")
+
+        assert mock_ticker.call_count == 1
+
+    @patch("yfinance.Ticker")
+    def test_concurrent_financials_fetched_once(self, mock_ticker):
+        """Test that concurrent requests for one ticker share a download."""
+        def slow_statement():
+            time.sleep(0.05)
+            return pd.DataFrame()
+
+        mock_ticker_instance = MagicMock()
+        financials = PropertyMock(side_effect=slow_statement)
+        type(mock_ticker_instance).financials = financials
+        mock_ticker_instance.balance_sheet = pd.DataFrame()
+        mock_ticker.return_value = mock_ticker_instance
+
+        fetcher = df.DataFetcher()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(fetcher.get_historical_financials, ["AAPL"] * 8))
+
+        assert financials.call_count == 1
+        assert all(r == results[0] for r in results)
+
+    @patch("yfinance.Ticker")
+    def test_concurrent_info_fetched_once(self, mock_ticker):
+        """Test that concurrent UDF calls for one ticker share a download."""
+        def slow_info():
+            time.sleep(0.05)
+            return {"currentPrice": 150.0}
+
+        mock_ticker_instance = MagicMock()
+        info = PropertyMock(side_effect=slow_info)
+        type(mock_ticker_instance).info = info
+        mock_ticker.return_value = mock_ticker_instance
+
+        fetcher = df.DataFetcher()
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            prices = list(pool.map(fetcher.get_price, ["AAPL"] * 16))
+
+        assert info.call_count == 1
+        assert prices == [150.0] * 16
+
+    @patch("yfinance.Ticker")
+    @patch("yfinance.Tickers")
+    def test_prefetch_reuses_batched_tickers(self, mock_tickers, mock_ticker):
+        """Test that prefetch stores the batch and fans fetches out to the pool."""
+        stocks = {"AAPL": MagicMock(), "MSFT": MagicMock()}
+        mock_tickers.return_value.tickers = stocks
+
+        def submit(fn, *args):
+            done = Future()
+            done.set_result(None)
+            return done
+
+        fetcher = df.DataFetcher()
+        with patch.object(fetcher._executor, "submit", side_effect=submit) as mock_submit:
+            fetcher.prefetch(["AAPL", "MSFT"])
+
+        mock_tickers.assert_called_once_with("AAPL MSFT")
+        assert fetcher._get_ticker("AAPL") is stocks["AAPL"]
+        assert fetcher._get_ticker("MSFT") is stocks["MSFT"]
+        mock_ticker.assert_not_called()
+
+        submitted = [call.args for call in mock_submit.call_args_list]
+        assert (fetcher.get_risk_free_rate,) in submitted
+        for symbol in stocks:
+            assert (fetcher.get_stock_info, symbol) in submitted
+            assert (fetcher.get_historical_financials, symbol) in submitted
+
+    def test_module_prefetch_uses_shared_fetcher(self):
+        """Test that the module-level prefetch delegates to the shared fetcher."""
+        with patch.object(df._fetcher, "prefetch") as mock_prefetch:
+            df.prefetch(["AAPL", "MSFT"])
+
+        mock_prefetch.assert_called_once_with(["AAPL", "MSFT"])
+
+    @patch("yfinance.Ticker")
+    def test_warm_populates_cache(self, mock_ticker):
+        """Test that warm() fetches info and financials up front."""
+        mock_ticker_instance = MagicMock()
+        mock_ticker_instance.info = {"currentPrice": 150.0}
+        mock_ticker_instance.financials.empty = True
+        mock_ticker_instance.balance_sheet.empty = True
+        mock_ticker.return_value = mock_ticker_instance
+
+        fetcher = df.DataFetcher()
+        with patch.object(fetcher, "get_risk_free_rate", return_value=0.04):
+            fetcher.warm("AAPL")
+
+        assert fetcher.cache.get("stock_info_AAPL", ttl=3600)["price"] == 150.0
+        assert fetcher.cache.get("financials_AAPL", ttl=3600) is not None
+
+    @patch("yfinance.Ticker")
+    def test_failed_fetch_not_retried_immediately(self, mock_ticker):
+        """Test that a failing ticker is negative-cached."""
+        mock_ticker.side_effect = Exception("API Error")
+
+        fetcher = df.DataFetcher()
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                fetcher.get_stock_info("INVALID")
+
+        assert mock_ticker.call_count == 1
+
+    @patch("fredapi.Fred")
     def test_get_risk_free_rate_fallback(self, mock_fred_class):
         """Test that risk-free rate has a fallback value."""
-        df.clear_cache()
-
         # Force fresh fetcher with mocked Fred
         mock_fred_instance = MagicMock()
         mock_fred_instance.get_series.side_effect = Exception("API Error")
@@ -115,11 +302,28 @@ class TestDataFetcher:
         # Should return fallback value
         assert rate == 0.04
 
+    @patch("fredapi.Fred")
+    def test_get_risk_free_rate(self, mock_fred_class):
+        """Test that the latest DGS10 observation is used."""
+        mock_fred_instance = MagicMock()
+        mock_fred_instance.get_series.return_value = pd.Series(
+            [4.1, 4.2, float("nan")]
+        )
+        mock_fred_class.return_value = mock_fred_instance
+
+        fetcher = df.DataFetcher()
+        rate = fetcher.get_risk_free_rate()
+
+        assert rate == pytest.approx(0.042)
+        assert type(rate) is float
+        # Only a recent window of the series is requested
+        assert "observation_start" in mock_fred_instance.get_series.call_args.kwargs
+
 
 class TestWACCCalculation:
     """Tests for WACC calculation."""
 
-    @patch("dcf_builder.data_fetcher.yf.Ticker")
+    @patch("yfinance.Ticker")
     def test_calculate_wacc(self, mock_ticker):
         """Test WACC calculation."""
         mock_ticker_instance = MagicMock()
@@ -134,11 +338,22 @@ class TestWACCCalculation:
         mock_ticker_instance.balance_sheet.empty = True
         mock_ticker.return_value = mock_ticker_instance
 
-        df.clear_cache()
-
         with patch.object(df._fetcher, "get_risk_free_rate", return_value=0.04):
             wacc = df.calculate_wacc("AAPL")
 
             # WACC should be a reasonable value
             assert wacc is not None
             assert 0 < wacc < 0.30  # Sanity check
+
+    def test_calculate_wacc_warm_cache_stays_on_thread(self):
+        """Test that cached inputs are read without the worker pool."""
+        cache = df._fetcher.cache
+        cache.set("stock_info_AAPL", {"beta": 1.0, "market_cap": 1e12})
+        cache.set("financials_AAPL", {"years": [], "balance_sheet": {}})
+        cache.set("risk_free_rate", 0.04)
+
+        with patch.object(df._fetcher, "_executor") as mock_executor:
+            wacc = df.calculate_wacc("AAPL")
+
+        mock_executor.submit.assert_not_called()
+        assert wacc == pytest.approx(0.04 + config.DEFAULT_EQUITY_RISK_PREMIUM)
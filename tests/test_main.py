@@ -0,0 +1,33 @@
+"""Tests for main module."""
+
+import pytest
+from unittest.mock import patch
+
+from dcf_builder import main
+
+
+class TestGenerateCommand:
+    """Tests for the generate CLI command."""
+
+    @patch("dcf_builder.main.generate_dcf_model")
+    @patch("dcf_builder.main.df")
+    def test_generate_prefetches_several_tickers(self, mock_df, mock_generate):
+        """Test that a multi-ticker run prefetches once, then builds each model."""
+        with patch("sys.argv", ["dcf-builder", "generate", "aapl", "msft"]):
+            main.main()
+
+        mock_df.prefetch.assert_called_once_with(["AAPL", "MSFT"])
+        assert [call.args[0] for call in mock_generate.call_args_list] == ["aapl", "msft"]
+
+    @patch("dcf_builder.main.generate_dcf_model")
+    @patch("dcf_builder.main.df")
+    def test_generate_rejects_output_with_several_tickers(self, mock_df, mock_generate):
+        """Test that --output is refused when more than one ticker is given."""
+        argv = ["dcf-builder", "generate", "AAPL", "MSFT", "--output", "model.xlsx"]
+        with patch("sys.argv", argv):
+            with pytest.raises(SystemExit) as exc_info:
+                main.main()
+
+        assert exc_info.value.code == 2
+        mock_df.prefetch.assert_not_called()
+        mock_generate.assert_not_called()
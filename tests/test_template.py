@@ -4,14 +4,24 @@ import pytest
 from unittest.mock import patch, MagicMock
 import tempfile
 from pathlib import Path
+from types import MappingProxyType
 
 from dcf_builder.template_generator import DCFTemplateGenerator, generate_dcf_model
 
 
-@pytest.fixture
+def _frozen(value):
+    """Recursively wrap dicts read-only, so shared fixture data can't drift."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _frozen(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_frozen(v) for v in value)
+    return value
+
+
+@pytest.fixture(scope="module")
 def mock_data():
-    """Mock data for template generation."""
-    return {
+    """Mock data for template generation, shared read-only by the module."""
+    return _frozen({
         "info": {
             "name": "Apple Inc.",
             "price": 150.0,
@@ -52,15 +62,55 @@ def mock_data():
         },
         "risk_free": 0.04,
         "wacc": 0.10,
-    }
+    })
+
+
+@pytest.fixture(scope="module")
+def generated_wb(mock_data, tmp_path_factory):
+    """Workbook generated once from mock_data, shared by read-only tests."""
+    with patch("dcf_builder.template_generator.df") as mock_df:
+        mock_df.get_stock_info.return_value = mock_data["info"]
+        mock_df.get_historical_financials.return_value = mock_data["financials"]
+        mock_df.get_risk_free_rate.return_value = mock_data["risk_free"]
+        mock_df.calculate_wacc.return_value = mock_data["wacc"]
+
+        output_path = tmp_path_factory.mktemp("dcf") / "test_dcf.xlsx"
+        result_path = DCFTemplateGenerator("AAPL").generate(output_path)
+
+    from openpyxl import load_workbook
+
+    return load_workbook(result_path, data_only=False)
 
 
 class TestDCFTemplateGenerator:
     """Tests for DCFTemplateGenerator class."""
 
-    @patch("dcf_builder.template_generator.df")
-    def test_generator_creates_all_sheets(self, mock_df, mock_data):
+    def test_generator_creates_all_sheets(self, generated_wb):
         """Test that generator creates all required sheets."""
+        expected_sheets = [
+            "Dashboard",
+            "Assumptions",
+            "Historical",
+            "Projections",
+            "Valuation",
+            "Comps",
+            "Sensitivity",
+            "Football Field",
+        ]
+
+        for sheet_name in expected_sheets:
+            assert sheet_name in generated_wb.sheetnames, f"Missing sheet: {sheet_name}"
+
+    def test_generator_populates_company_info(self, generated_wb):
+        """Test that company info is populated correctly."""
+        # Check Dashboard has company name
+        dashboard = generated_wb["Dashboard"]
+        assert "Apple Inc." in str(dashboard["A1"].value)
+        assert "AAPL" in str(dashboard["A1"].value)
+
+    @patch("dcf_builder.template_generator.df")
+    def test_generate_dcf_model_function(self, mock_df, mock_data):
+        """Test the convenience function."""
         mock_df.get_stock_info.return_value = mock_data["info"]
         mock_df.get_historical_financials.return_value = mock_data["financials"]
         mock_df.get_risk_free_rate.return_value = mock_data["risk_free"]
@@ -68,33 +118,68 @@ class TestDCFTemplateGenerator:
 
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "test_dcf.xlsx"
-            generator = DCFTemplateGenerator("AAPL")
-            result_path = generator.generate(output_path)
+            result_path = generate_dcf_model("AAPL", output_path)
 
             assert result_path.exists()
+            assert result_path.suffix == ".xlsx"
+
+    @patch("dcf_builder.template_generator.df")
+    def test_generator_survives_missing_financials(self, mock_df, mock_data):
+        """Test that a financials failure still produces a model."""
+        mock_df.get_stock_info.return_value = mock_data["info"]
+        mock_df.get_historical_financials.side_effect = RuntimeError("API Error")
+        mock_df.get_risk_free_rate.return_value = mock_data["risk_free"]
+        mock_df.calculate_wacc.side_effect = RuntimeError("API Error")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_path = Path(tmpdir) / "test_dcf.xlsx"
+            generator = DCFTemplateGenerator("AAPL")
+            generator.generate(output_path)
 
-            # Load workbook and check sheets
             from openpyxl import load_workbook
 
-            wb = load_workbook(result_path)
+            wb = load_workbook(output_path, read_only=True)
+            assert wb["Historical"]["A3"].value == "No historical data available"
+            wb.close()
+            assert generator.data["wacc"] is None
+
+    def test_merged_headers_can_be_unmerged(self):
+        """Test that header merges are real merged ranges on the live sheet."""
+        ws = DCFTemplateGenerator("AAPL").wb.active
+        DCFTemplateGenerator._merge(ws, ["A1:H1", "A2:H2"])
+        ws.unmerge_cells("A1:H1")
+
+        assert [str(r) for r in ws.merged_cells.ranges] == ["A2:H2"]
+
 
-            expected_sheets = [
-                "Dashboard",
-                "Assumptions",
-                "Historical",
-                "Projections",
-                "Valuation",
-                "Comps",
-                "Sensitivity",
-                "Football Field",
-            ]
+class TestTemplateFormulas:
+    """Tests for formula correctness in templates."""
+
+    def test_valuation_sheet_has_formulas(self, generated_wb):
+        """Test that valuation sheet contains proper formulas."""
+        valuation = generated_wb["Valuation"]
+
+        # Check that key cells contain formulas
+        # Terminal value should reference WACC and growth rate
+        tv_cell = valuation["B9"]
+        assert tv_cell.value is not None
 
-            for sheet_name in expected_sheets:
-                assert sheet_name in wb.sheetnames, f"Missing sheet: {sheet_name}"
+    def test_per_share_value_links(self, generated_wb):
+        """Test that the dashboard and football field read the DCF value per share."""
+        valuation = generated_wb["Valuation"]
 
+        # Enterprise value sums the discounted forecast and terminal value
+        assert valuation["B16"].value == "=B12+B13"
+        assert valuation["B12"].value.startswith("=SUMPRODUCT(")
+
+        assert valuation["A21"].value == "DCF Value per Share"
+        assert generated_wb["Dashboard"]["F6"].value == "=Valuation!B21"
+        assert generated_wb["Football Field"]["B5"].value == "=Valuation!B21"
+
+    @patch("dcf_builder.template_generator.config.DEFAULT_PROJECTION_YEARS", 3)
     @patch("dcf_builder.template_generator.df")
-    def test_generator_populates_company_info(self, mock_df, mock_data):
-        """Test that company info is populated correctly."""
+    def test_valuation_follows_projection_years(self, mock_df, mock_data):
+        """Test that discounting covers the configured forecast horizon."""
         mock_df.get_stock_info.return_value = mock_data["info"]
         mock_df.get_historical_financials.return_value = mock_data["financials"]
         mock_df.get_risk_free_rate.return_value = mock_data["risk_free"]
@@ -102,21 +187,26 @@ class TestDCFTemplateGenerator:
 
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "test_dcf.xlsx"
-            generator = DCFTemplateGenerator("AAPL")
-            result_path = generator.generate(output_path)
+            DCFTemplateGenerator("AAPL").generate(output_path)
 
             from openpyxl import load_workbook
 
-            wb = load_workbook(result_path)
+            wb = load_workbook(output_path, data_only=False)
+            valuation = wb["Valuation"]
+
+            # Three forecast years in B:D, terminal year in E
+            assert wb["Projections"].max_column == 5
+            assert valuation["B6"].value == "=Projections!E15"
+            assert valuation["B12"].value == "=SUMPRODUCT(Projections!B15:D15/(1+$B$4)^{1,2,3})"
+            assert valuation["B13"].value == "=B9/(1+$B$4)^3"
+
 
-            # Check Dashboard has company name
-            dashboard = wb["Dashboard"]
-            assert "Apple Inc." in str(dashboard["A1"].value)
-            assert "AAPL" in str(dashboard["A1"].value)
+class TestValuesMode:
+    """Tests for generating evaluated values instead of formulas."""
 
     @patch("dcf_builder.template_generator.df")
-    def test_generate_dcf_model_function(self, mock_df, mock_data):
-        """Test the convenience function."""
+    def test_values_mode_writes_no_formulas(self, mock_df, mock_data):
+        """Test that values mode leaves no formulas to recalculate."""
         mock_df.get_stock_info.return_value = mock_data["info"]
         mock_df.get_historical_financials.return_value = mock_data["financials"]
         mock_df.get_risk_free_rate.return_value = mock_data["risk_free"]
@@ -124,34 +214,54 @@ class TestDCFTemplateGenerator:
 
         with tempfile.TemporaryDirectory() as tmpdir:
             output_path = Path(tmpdir) / "test_dcf.xlsx"
-            result_path = generate_dcf_model("AAPL", output_path)
+            DCFTemplateGenerator("AAPL", mode="values").generate(output_path)
 
-            assert result_path.exists()
-            assert result_path.suffix == ".xlsx"
+            from openpyxl import load_workbook
 
+            wb = load_workbook(output_path)
+            for ws in wb:
+                for row in ws.iter_rows(values_only=True):
+                    formulas = [v for v in row if isinstance(v, str) and v.startswith("=")]
+                    assert not formulas
 
-class TestTemplateFormulas:
-    """Tests for formula correctness in templates."""
+            # Revenue grows from the latest year, in millions
+            projections = wb["Projections"]
+            assert projections["B4"].value == pytest.approx(400000.0)
+            assert projections["C4"].value == pytest.approx(420000.0)
+
+            per_share = wb["Valuation"]["B21"].value
+            assert per_share > 0
+            assert wb["Dashboard"]["F6"].value == pytest.approx(per_share)
+            assert wb["Football Field"]["B5"].value == pytest.approx(per_share)
 
     @patch("dcf_builder.template_generator.df")
-    def test_valuation_sheet_has_formulas(self, mock_df, mock_data):
-        """Test that valuation sheet contains proper formulas."""
-        mock_df.get_stock_info.return_value = mock_data["info"]
+    def test_values_mode_wacc_equal_to_terminal_growth(self, mock_df, mock_data):
+        """Test that a zero Gordon growth divisor gives #DIV/0! like Excel."""
+        from dcf_builder import template_generator as tg
+
+        mock_df.get_stock_info.return_value = {**mock_data["info"], "beta": 0}
         mock_df.get_historical_financials.return_value = mock_data["financials"]
-        mock_df.get_risk_free_rate.return_value = mock_data["risk_free"]
+        mock_df.get_risk_free_rate.return_value = 0.0
         mock_df.calculate_wacc.return_value = mock_data["wacc"]
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "test_dcf.xlsx"
-            generator = DCFTemplateGenerator("AAPL")
-            generator.generate(output_path)
+        # With no equity premium the WACC is just the after-tax debt leg
+        wacc = tg.COST_OF_DEBT * (1 - tg.config.DEFAULT_TAX_RATE) * tg.DEBT_TO_CAPITAL
 
-            from openpyxl import load_workbook
+        with patch.object(tg.config, "DEFAULT_TERMINAL_GROWTH", wacc):
+            with tempfile.TemporaryDirectory() as tmpdir:
+                output_path = Path(tmpdir) / "test_dcf.xlsx"
+                DCFTemplateGenerator("AAPL", mode="values").generate(output_path)
 
-            wb = load_workbook(output_path, data_only=False)
-            valuation = wb["Valuation"]
+                from openpyxl import load_workbook
+
+                wb = load_workbook(output_path)
+                valuation = wb["Valuation"]
+                assert valuation["B9"].value == "#DIV/0!"
+                assert valuation["B16"].value == "#DIV/0!"
+                assert valuation["B21"].value == "#DIV/0!"
+                assert valuation["B12"].value > 0
 
-            # Check that key cells contain formulas
-            # Terminal value should reference WACC and growth rate
-            tv_cell = valuation["B9"]
-            assert tv_cell.value is not None
+    def test_invalid_mode_rejected(self):
+        """Test that an unknown mode fails fast."""
+        with pytest.raises(ValueError):
+            DCFTemplateGenerator("AAPL", mode="cached")